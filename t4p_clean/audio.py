@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import os
 
 import aud
@@ -122,6 +123,33 @@ def _play_warning_sound(context: bpy.types.Context | None = None) -> None:
     _play_sound(context, _WARNING_SOUND_PATH)
 
 
+def _play_sound_async(sound_path: str) -> None:
+    """Queue ``sound_path`` for playback so audio setup never blocks the caller.
+
+    Playback is deferred to a main-thread timer, which keeps the shared audio
+    device and playback handles on a single thread.
+    """
+
+    if bpy.app.background:
+        return
+
+    bpy.app.timers.register(
+        functools.partial(_play_sound, None, sound_path), first_interval=0.0
+    )
+
+
+def _play_happy_sound_async() -> None:
+    """Queue the confirmation chime without waiting for the audio device."""
+
+    _play_sound_async(_HAPPY_SOUND_PATH)
+
+
+def _play_warning_sound_async() -> None:
+    """Queue the warning chime without waiting for the audio device."""
+
+    _play_sound_async(_WARNING_SOUND_PATH)
+
+
 def _disable_profiling_for_audio() -> None:
     """Prevent profiling decorators from wrapping audio helper functions."""
 
@@ -132,5 +160,8 @@ def _disable_profiling_for_audio() -> None:
             _play_sound,
             _play_happy_sound,
             _play_warning_sound,
+            _play_sound_async,
+            _play_happy_sound_async,
+            _play_warning_sound_async,
     ):
         setattr(function, "_t4p_profile_wrapped", True)
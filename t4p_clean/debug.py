@@ -1,6 +1,7 @@
 """Debug utilities for the T4P clean add-on."""
 from __future__ import annotations
 
+import os
 import time
 from dataclasses import dataclass
 from functools import wraps
@@ -48,6 +49,10 @@ def _is_excluded_class(cls: type) -> bool:
     return False
 
 DEBUG_PREFERENCE_ATTR = "enable_debug_output"
+# Function timing wrappers are only installed when Blender is started with
+# this environment variable set; otherwise every call would pay for them.
+PROFILE_ENV_VAR = "T4P_PROFILE"
+_PROFILING_REQUESTED = bool(os.environ.get(PROFILE_ENV_VAR))
 _DEBUG_PREFIX = "[T4P][debug]"
 _FuncT = TypeVar("_FuncT", bound=Callable[..., Any])
 
@@ -122,6 +127,15 @@ def is_debug_output_enabled() -> bool:
     return bool(getattr(preferences, DEBUG_PREFERENCE_ATTR, False))
 
 
+def log_debug(message: str) -> None:
+    """Print ``message`` when debug output is enabled in the add-on preferences."""
+
+    if not is_debug_output_enabled():
+        return
+
+    print(f"{_DEBUG_PREFIX} {message}")
+
+
 def profiled(function: _FuncT) -> _FuncT:
     """Wrap ``function`` to log its execution time when debugging is enabled."""
 
@@ -173,7 +187,13 @@ def profiled(function: _FuncT) -> _FuncT:
 
 
 def profile_module(namespace: dict[str, Any]) -> None:
-    """Profile all functions defined in the given module namespace."""
+    """Profile all functions defined in the given module namespace.
+
+    Does nothing unless ``PROFILE_ENV_VAR`` is set in the environment.
+    """
+
+    if not _PROFILING_REQUESTED:
+        return
 
     module_name = namespace.get("__name__")
     if not isinstance(module_name, str):
@@ -199,4 +219,11 @@ def profile_module(namespace: dict[str, Any]) -> None:
                 setattr(value, attr_name, profiled(attr_value))
 
 
-__all__ = ("DEBUG_PREFERENCE_ATTR", "is_debug_output_enabled", "profiled", "profile_module")
+__all__ = (
+    "DEBUG_PREFERENCE_ATTR",
+    "PROFILE_ENV_VAR",
+    "is_debug_output_enabled",
+    "log_debug",
+    "profiled",
+    "profile_module",
+)
@@ -9,6 +9,7 @@ from typing import MutableSequence
 
 import bmesh
 import bpy
+import numpy as np
 from bpy.props import BoolProperty, FloatProperty, IntProperty, StringProperty
 from mathutils.bvhtree import BVHTree
 
@@ -41,6 +42,17 @@ _CHECKSUM_CACHE_VALUE_KEY = "t4p_mesh_checksum_cache_value"
 _CHECKSUM_CACHE_TIME_KEY = "t4p_mesh_checksum_cache_time"
 _CHECKSUM_CACHE_DURATION_SECONDS = 5 * 60
 
+# Overlap trees built from Object mode mesh data, keyed by the mesh's
+# ``session_uid``, which unlike its pointer is never reused for another mesh.
+# Each entry holds the vertex and polygon counts it was built for, the tree
+# and the polygon index of every tree triangle. Entries are dropped when the
+# depsgraph reports a geometry update for the mesh, the whole cache is
+# cleared on file load, undo and redo, and only the most recently used
+# ``_BVH_CACHE_SIZE`` entries are kept.
+_BVH_CACHE_SIZE = 16
+_BVH_CACHE: dict[int, tuple[tuple[int, int], BVHTree, np.ndarray]] = {}
+_BVH_CACHE_CLEAR_HANDLERS = ("load_post", "undo_post", "redo_post")
+
 
 @contextmanager
 def window_manager_progress(
@@ -121,7 +133,10 @@ class T4PAddonPreferences(bpy.types.AddonPreferences):
 
     enable_debug_output: BoolProperty(
         name="Enable debug output",
-        description="Log profiling information when running add-on functions",
+        description=(
+            "Log debug messages, and function timings when Blender was started "
+            "with T4P_PROFILE set"
+        ),
         default=False,
     )
 
@@ -130,9 +145,19 @@ class T4PAddonPreferences(bpy.types.AddonPreferences):
         layout.prop(self, DEBUG_PREFERENCE_ATTR, text="Enable debug output")
 
 
-def _triangulate_bmesh(bm: bmesh.types.BMesh) -> None:
+def _triangulate_bmesh(bm: bmesh.types.BMesh) -> bool:
+    """Triangulate ``bm`` and return ``True`` when any face was split."""
     faces = [face for face in bm.faces]
-    bmesh.ops.triangulate(bm, faces=faces)
+    result = bmesh.ops.triangulate(bm, faces=faces)
+    return bool(result.get("edges"))
+
+
+def mesh_is_triangulated(mesh: bpy.types.Mesh) -> bool:
+    """Return ``True`` when every polygon of ``mesh`` is already a triangle."""
+
+    loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    return bool((loop_totals == 3).all())
 
 
 def select_non_manifold_verts(
@@ -160,6 +185,103 @@ def count_non_manifold_verts(bm):
     return sum((1 for v in bm.verts if v.select))
 
 
+def bmesh_count_non_manifold_verts(bm: bmesh.types.BMesh) -> int:
+    """Count vertices on boundary, wire or non-manifold geometry in ``bm``.
+
+    Unlike ``count_non_manifold_verts`` this reads the BMesh directly and
+    leaves the edit-mode selection untouched.
+    """
+
+    return sum(1 for vert in bm.verts if vert.is_boundary or not vert.is_manifold)
+
+
+def label_connected_components(
+        node_count: int, link_a: np.ndarray, link_b: np.ndarray
+) -> np.ndarray:
+    """Return the smallest node index of each node's connected component.
+
+    Every round hooks the root of each link end onto the smaller of the two
+    roots, then flattens the trees by pointer jumping until each node points
+    straight at its root.
+    """
+
+    labels = np.arange(node_count, dtype=np.int32)
+    if link_a.size == 0:
+        return labels
+
+    while True:
+        roots_a = labels[link_a]
+        roots_b = labels[link_b]
+        lowest = np.minimum(roots_a, roots_b)
+        hooked = labels.copy()
+        np.minimum.at(hooked, roots_a, lowest)
+        np.minimum.at(hooked, roots_b, lowest)
+        while True:
+            jumped = hooked[hooked]
+            if np.array_equal(jumped, hooked):
+                break
+            hooked = jumped
+        if np.array_equal(hooked, labels):
+            return labels
+        labels = hooked
+
+
+def mesh_count_non_manifold_verts(mesh: bpy.types.Mesh) -> int:
+    """Count the vertices ``bmesh_count_non_manifold_verts`` would report.
+
+    Works on the Object mode mesh arrays, so no BMesh is built. A vertex is
+    counted when it is loose, touches an edge without exactly two faces, or
+    when its face corners split into more than one fan.
+    """
+
+    vertex_count = len(mesh.vertices)
+    edge_count = len(mesh.edges)
+    loop_count = len(mesh.loops)
+    if vertex_count == 0:
+        return 0
+
+    edge_verts = np.empty(edge_count * 2, dtype=np.int32)
+    mesh.edges.foreach_get("vertices", edge_verts)
+    edge_verts = edge_verts.reshape(-1, 2)
+    loop_verts = np.empty(loop_count, dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_verts)
+    loop_edges = np.empty(loop_count, dtype=np.int32)
+    mesh.loops.foreach_get("edge_index", loop_edges)
+
+    flagged = np.ones(vertex_count, dtype=bool)
+    flagged[edge_verts.ravel()] = False
+    face_counts = np.bincount(loop_edges, minlength=edge_count)
+    flagged[edge_verts[face_counts != 2].ravel()] = True
+    if loop_count == 0:
+        return int(flagged.sum())
+
+    loop_starts = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_start", loop_starts)
+    loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    previous_loops = np.arange(-1, loop_count - 1, dtype=np.int32)
+    previous_loops[loop_starts] = loop_starts + loop_totals - 1
+
+    # Each corner is linked to the two vertex-side ends of the edges it sits
+    # between; corners of one vertex that end up in different components
+    # belong to separate fans.
+    node_count = loop_count + 2 * edge_count
+    loops = np.arange(loop_count, dtype=np.int32)
+    ends = []
+    for edges in (loop_edges, loop_edges[previous_loops]):
+        side = edge_verts[edges, 1] == loop_verts
+        ends.append(loop_count + 2 * edges + side)
+    labels = label_connected_components(
+        node_count,
+        np.concatenate((loops, loops)),
+        np.concatenate(ends).astype(np.int32),
+    )
+    fans = np.unique(loop_verts.astype(np.int64) * node_count + labels[:loop_count])
+    fan_counts = np.bincount(fans // node_count, minlength=vertex_count)
+    flagged |= fan_counts > 1
+    return int(flagged.sum())
+
+
 def _clear_cached_mesh_checksum(obj: bpy.types.Object | None) -> None:
     """Remove cached checksum data stored on ``obj``."""
 
@@ -334,19 +456,27 @@ def mesh_checksum_fast(obj, decimals=3):
     me = obj.data
 
     # --- vertex coords (fast path) ---
-    n = len(me.vertices) * 3
-    coords = [0.0] * n
+    coords = np.empty(len(me.vertices) * 3, dtype=np.float64)
     me.vertices.foreach_get("co", coords)
 
     q = 10 ** decimals  # rounding factor
     # quantize to integers (rounding) to keep it stable and compact
-    coords_q = array.array('i', (int(round(c * q)) for c in coords))
+    coords_q = np.rint(coords * q).astype(np.int32)
 
     # --- polygon topology (vertex indices with separators) ---
-    poly_idx = array.array('i')
-    for p in me.polygons:
-        poly_idx.extend(p.vertices)  # indices
-        poly_idx.append(-1)          # separator
+    loop_starts = np.empty(len(me.polygons), dtype=np.int32)
+    loop_totals = np.empty(len(me.polygons), dtype=np.int32)
+    me.polygons.foreach_get("loop_start", loop_starts)
+    me.polygons.foreach_get("loop_total", loop_totals)
+    loop_verts = np.empty(len(me.loops), dtype=np.int32)
+    me.loops.foreach_get("vertex_index", loop_verts)
+
+    # Gather each polygon's loops in polygon order, then put a -1 after each.
+    poly_ends = np.cumsum(loop_totals)
+    loop_order = np.arange(poly_ends[-1] if len(poly_ends) else 0) + np.repeat(
+        loop_starts - (poly_ends - loop_totals), loop_totals
+    )
+    poly_idx = np.insert(loop_verts[loop_order], poly_ends, -1).astype(np.int32)
 
     # --- hash (blake2b is fast and stable) ---
     h = hashlib.blake2b(digest_size=16)
@@ -363,7 +493,10 @@ def bmesh_get_intersecting_face_indices(
     if bm is None or len(bm.faces) == 0:
         return array.array("i", ())
 
-    bm = bm.copy()
+    # The tree reports faces by index, so make sure the indices are current
+    # instead of building the tree from a freshly indexed copy.
+    bm.verts.index_update()
+    bm.faces.index_update()
     tree = BVHTree.FromBMesh(bm, epsilon=0.00001)
     if tree is None:
         return array.array("i", ())
@@ -373,36 +506,102 @@ def bmesh_get_intersecting_face_indices(
         return array.array("i", ())
 
     faces_error = {index for pair in overlap for index in pair}
-    bm.free()
     return array.array("i", faces_error)
 
 
-def select_faces(face_indices: MutableSequence[int], mesh, bm):
-    bm.faces.ensure_lookup_table()
+def mesh_get_intersecting_face_indices(
+    mesh: bpy.types.Mesh | None,
+) -> MutableSequence[int]:
+    """Return the indices of polygons that overlap within ``mesh``.
 
-    for i in face_indices:
-        if 0 <= i < len(bm.faces):
-            bm.faces[i].select_set(True)
+    Reads the Object mode mesh arrays directly, so unlike
+    ``bmesh_get_intersecting_face_indices`` no BMesh has to be built.
+    """
 
-    bmesh.update_edit_mesh(mesh, loop_triangles=False, destructive=False)
+    if mesh is None or len(mesh.polygons) == 0:
+        return array.array("i", ())
+
+    tree, tri_polygons = _get_or_build_mesh_bvh(mesh)
+    overlap = tree.overlap(tree)
+    if not overlap:
+        return array.array("i", ())
 
+    overlap_tris = np.array(overlap, dtype=np.int32).ravel()
+    faces_error = np.unique(tri_polygons[overlap_tris])
+    return array.array("i", faces_error.tobytes())
+
+
+def _get_or_build_mesh_bvh(
+    mesh: bpy.types.Mesh,
+) -> tuple[BVHTree, np.ndarray]:
+    """Return the overlap tree of ``mesh`` and the polygon of each triangle."""
+
+    key = mesh.session_uid
+    counts = (len(mesh.vertices), len(mesh.polygons))
+    cached = _BVH_CACHE.pop(key, None)
+    if cached is not None and cached[0] == counts:
+        # Re-inserting moves the entry to the most recently used end.
+        _BVH_CACHE[key] = cached
+        return cached[1], cached[2]
+
+    mesh.calc_loop_triangles()
+    coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", coords)
+    tri_count = len(mesh.loop_triangles)
+    tri_verts = np.empty(tri_count * 3, dtype=np.int32)
+    mesh.loop_triangles.foreach_get("vertices", tri_verts)
+    tri_polygons = np.empty(tri_count, dtype=np.int32)
+    mesh.loop_triangles.foreach_get("polygon_index", tri_polygons)
+
+    tree = BVHTree.FromPolygons(
+        coords.reshape(-1, 3).tolist(),
+        tri_verts.reshape(-1, 3).tolist(),
+        all_triangles=True,
+        epsilon=0.00001,
+    )
+    _BVH_CACHE[key] = (counts, tree, tri_polygons)
+    while len(_BVH_CACHE) > _BVH_CACHE_SIZE:
+        del _BVH_CACHE[next(iter(_BVH_CACHE))]
+    return tree, tri_polygons
 
-def select_edge(edge_indices: MutableSequence[int], mesh, bm):
-    bm.edges.ensure_lookup_table()
 
-    for i in edge_indices:
-        if 0 <= i < len(bm.edges):
-            bm.edges[i].select_set(True)
+@bpy.app.handlers.persistent
+def _clear_bvh_cache(*_args) -> None:
+    """Drop every cached overlap tree."""
 
-    bmesh.update_edit_mesh(mesh, loop_triangles=False, destructive=False)
+    _BVH_CACHE.clear()
 
 
-def select_verts(vert_indices: MutableSequence[int], mesh, bm):
-    bm.verts.ensure_lookup_table()
+@bpy.app.handlers.persistent
+def _invalidate_bvh_cache(scene, depsgraph) -> None:
+    """Drop cached overlap trees of meshes whose geometry changed."""
 
-    for i in vert_indices:
-        if 0 <= i < len(bm.verts):
-            bm.verts[i].select_set(True)
+    if not _BVH_CACHE:
+        return
+
+    for update in depsgraph.updates:
+        if not update.is_updated_geometry:
+            continue
+        data = update.id.original
+        if isinstance(data, bpy.types.Object):
+            data = data.data
+        if isinstance(data, bpy.types.Mesh):
+            invalidate_mesh_bvh(data)
+
+
+def invalidate_mesh_bvh(mesh: bpy.types.Mesh) -> None:
+    """Forget the cached overlap tree of ``mesh`` after editing it."""
+
+    _BVH_CACHE.pop(mesh.session_uid, None)
+
+
+def select_faces(face_indices: MutableSequence[int], mesh, bm):
+    bm.faces.ensure_lookup_table()
+
+    # Callers pass indices read from this same BMesh, so they are in range.
+    faces = bm.faces
+    for i in face_indices:
+        faces[i].select_set(True)
 
     bmesh.update_edit_mesh(mesh, loop_triangles=False, destructive=False)
 
@@ -526,9 +725,19 @@ def register() -> None:
     )
     for cls in _iter_classes():
         bpy.utils.register_class(cls)
+    bpy.app.handlers.depsgraph_update_post.append(_invalidate_bvh_cache)
+    for handler_name in _BVH_CACHE_CLEAR_HANDLERS:
+        getattr(bpy.app.handlers, handler_name).append(_clear_bvh_cache)
 
 
 def unregister() -> None:
+    if _invalidate_bvh_cache in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_invalidate_bvh_cache)
+    for handler_name in _BVH_CACHE_CLEAR_HANDLERS:
+        handlers = getattr(bpy.app.handlers, handler_name)
+        if _clear_bvh_cache in handlers:
+            handlers.remove(_clear_bvh_cache)
+    _BVH_CACHE.clear()
     for cls in reversed(_iter_classes()):
         bpy.utils.unregister_class(cls)
     if hasattr(bpy.types.Scene, "t4p_smooth_intersection_attempts"):
@@ -567,6 +776,8 @@ __all__ = (
     "update_ui_modal_progress",
     "finish_ui_modal_progress",
     "_triangulate_bmesh",
+    "invalidate_mesh_bvh",
+    "mesh_get_intersecting_face_indices",
     "T4PAddonPreferences",
     "set_object_analysis_stats",
 )
@@ -15,9 +15,12 @@ from ..main import (
     bmesh_get_intersecting_face_indices,
     count_non_manifold_verts,
     get_bmesh,
+    mesh_count_non_manifold_verts,
+    mesh_get_intersecting_face_indices,
+    mesh_is_triangulated,
     set_object_analysis_stats,
 )
-from .modal_utils import ModalTimerMixin
+from .modal_utils import ModalTimerMixin, deselect_objects
 
 
 @dataclass
@@ -145,7 +148,7 @@ class T4P_OT_analyze_selection(ModalTimerMixin, Operator):
         state.initial_active = context.view_layer.objects.active
         state.objects_to_process = mesh_objects
 
-        bpy.ops.object.select_all(action="DESELECT")
+        deselect_objects(selected_objects)
 
         return self._start_modal(context, len(mesh_objects))
 
@@ -163,6 +166,15 @@ class T4P_OT_analyze_selection(ModalTimerMixin, Operator):
         if state.scene is not None and state.scene.objects.get(obj.name) is None:
             return
 
+        mesh = obj.data
+        if mesh_is_triangulated(mesh):
+            # Nothing has to be triangulated, so both counts come straight
+            # from the Object mode mesh arrays without entering Edit mode.
+            non_manifold_count = mesh_count_non_manifold_verts(mesh)
+            intersection_count = len(mesh_get_intersecting_face_indices(mesh))
+            self._record_analysis(obj, non_manifold_count, intersection_count)
+            return
+
         context.view_layer.objects.active = obj
         obj.select_set(True)
 
@@ -172,7 +184,6 @@ class T4P_OT_analyze_selection(ModalTimerMixin, Operator):
             obj.select_set(False)
             return
 
-        mesh = obj.data
         _triangulate_edit_mesh(mesh)
         non_manifold_count = _count_non_manifold_vertices(mesh)
         bpy.ops.mesh.select_all(action="DESELECT")
@@ -181,6 +192,12 @@ class T4P_OT_analyze_selection(ModalTimerMixin, Operator):
         bpy.ops.object.mode_set(mode="OBJECT")
         obj.select_set(False)
 
+        self._record_analysis(obj, non_manifold_count, intersection_count)
+
+    def _record_analysis(
+        self, obj: bpy.types.Object, non_manifold_count: int, intersection_count: int
+    ) -> None:
+        state = self._state
         set_object_analysis_stats(
             obj,
             non_manifold_count=int(non_manifold_count),
@@ -7,7 +7,7 @@ from dataclasses import dataclass, field
 import bpy
 from bpy.types import Operator
 
-from ..audio import _play_happy_sound
+from ..audio import _play_happy_sound_async
 from ..debug import profile_module
 from ..main import BATCH_DECIMATE_OPERATOR_IDNAME
 from .modal_utils import ModalTimerMixin
@@ -77,7 +77,7 @@ class T4P_OT_batch_decimate(ModalTimerMixin, Operator):
         mesh_objects = self._collect_mesh_objects(context)
         if not mesh_objects:
             self.report({"INFO"}, "No mesh objects selected.")
-            _play_happy_sound(context)
+            _play_happy_sound_async()
             return {"FINISHED"}
 
         state.ratio = ratio
@@ -152,7 +152,7 @@ class T4P_OT_batch_decimate(ModalTimerMixin, Operator):
         else:
             self.report({"INFO"}, "Decimation modifiers could not be applied.")
 
-        _play_happy_sound(context)
+        _play_happy_sound_async()
         return {"CANCELLED" if cancelled else "FINISHED"}
 
 
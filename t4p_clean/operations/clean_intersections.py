@@ -3,24 +3,45 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from typing import MutableSequence
 
 import bmesh
 import bpy
+import numpy as np
 from bpy.types import Operator
 
 from mathutils import Vector
 
-from ..audio import _play_happy_sound, _play_warning_sound
-from ..debug import profile_module
+from ..audio import _play_happy_sound_async, _play_warning_sound_async
+from ..debug import is_debug_output_enabled, log_debug, profile_module
 from ..main import (
     SMOOTH_OPERATOR_IDNAME,
     _triangulate_bmesh,
     bmesh_get_intersecting_face_indices,
     get_bmesh,
+    get_cached_self_intersection_count,
+    invalidate_mesh_bvh,
     mesh_checksum_fast,
+    mesh_get_intersecting_face_indices,
+    mesh_is_triangulated,
     select_faces,
+    set_object_analysis_stats,
 )
-from .modal_utils import ModalTimerMixin
+from .modal_utils import ModalTimerMixin, deselect_objects
+
+
+# Run shrink/fatten attempts directly on the BMesh; set to ``False`` to fall
+# back to the ``bpy.ops`` transform and smooth operators.
+_USE_BMESH_SHRINK_FATTEN = True
+
+# Bumped by every step that edits mesh geometry, so callers can tell whether
+# a cleaning run changed anything without hashing the mesh twice.
+_mesh_mutation_count = 0
+
+
+def _record_mesh_mutation() -> None:
+    global _mesh_mutation_count
+    _mesh_mutation_count += 1
 
 
 @dataclass
@@ -49,155 +70,255 @@ def _shrink_selection(times: int) -> None:
 def _calculate_faces_bounding_box(
     faces: list[bmesh.types.BMFace],
 ) -> tuple[Vector, Vector]:
-    coords = [
-        vert.co
-        for face in faces
-        if face.is_valid
-        for vert in face.verts
-    ]
-    if not coords:
+    verts = {vert for face in faces if face.is_valid for vert in face.verts}
+    if not verts:
         origin = Vector((0.0, 0.0, 0.0))
         return origin.copy(), origin.copy()
 
-    xs = [co.x for co in coords]
-    ys = [co.y for co in coords]
-    zs = [co.z for co in coords]
-    return Vector((min(xs), min(ys), min(zs))), Vector((max(xs), max(ys), max(zs)))
+    coords = np.array([vert.co for vert in verts], dtype=np.float64)
+    return Vector(coords.min(axis=0).tolist()), Vector(coords.max(axis=0).tolist())
 
 
-def _bounding_boxes_intersect(
-    box_a: tuple[Vector, Vector], box_b: tuple[Vector, Vector]
-) -> bool:
-    min_a, max_a = box_a
-    min_b, max_b = box_b
-    return (
-        max_a.x >= min_b.x
-        and max_b.x >= min_a.x
-        and max_a.y >= min_b.y
-        and max_b.y >= min_a.y
-        and max_a.z >= min_b.z
-        and max_b.z >= min_a.z
-    )
+def _merge_bounding_boxes(
+    boxes: list[tuple[Vector, Vector]]
+) -> tuple[Vector, Vector]:
+    mins = np.array([box[0] for box in boxes], dtype=np.float64)
+    maxs = np.array([box[1] for box in boxes], dtype=np.float64)
+    return Vector(mins.min(axis=0).tolist()), Vector(maxs.max(axis=0).tolist())
+
+
+def _find_group_root(parent: list[int], index: int) -> int:
+    while parent[index] != index:
+        parent[index] = parent[parent[index]]
+        index = parent[index]
+    return index
+
+
+def _union_groups(parent: list[int], index_a: int, index_b: int) -> None:
+    root_a = _find_group_root(parent, index_a)
+    root_b = _find_group_root(parent, index_b)
+    if root_a != root_b:
+        parent[max(root_a, root_b)] = min(root_a, root_b)
 
 
 def _group_intersecting_bounding_boxes(
     boxes: list[tuple[Vector, Vector]]
 ) -> list[list[int]]:
-    adjacency: list[set[int]] = [set() for _ in boxes]
-    for idx_a in range(len(boxes)):
-        for idx_b in range(idx_a + 1, len(boxes)):
-            if _bounding_boxes_intersect(boxes[idx_a], boxes[idx_b]):
-                adjacency[idx_a].add(idx_b)
-                adjacency[idx_b].add(idx_a)
-
-    visited: set[int] = set()
-    groups: list[list[int]] = []
-    for start in range(len(boxes)):
-        if start in visited:
-            continue
+    """Group boxes that overlap, directly or through other boxes.
 
-        stack = [start]
-        group: list[int] = []
-        while stack:
-            current = stack.pop()
-            if current in visited:
-                continue
-            visited.add(current)
-            group.append(current)
-            stack.extend(adjacency[current])
-
-        groups.append(group)
+    Boxes are swept along the axis where they vary the most, so each box is
+    only tested against the boxes whose range on that axis starts inside its
+    own. The remaining axes are tested in the same order of variance, and
+    pairs that fail one axis are dropped before the next is checked.
+    """
 
-    return groups
+    if not boxes:
+        return []
+
+    mins = np.array([box[0] for box in boxes], dtype=np.float64)
+    maxs = np.array([box[1] for box in boxes], dtype=np.float64)
+    variances = mins.var(axis=0) + maxs.var(axis=0)
+    sweep_axis, *test_axes = np.argsort(-variances, kind="stable").tolist()
+    order = np.argsort(mins[:, sweep_axis], kind="stable")
+    sorted_mins = mins[order, sweep_axis]
+    parent = list(range(len(boxes)))
+
+    positions = np.arange(len(boxes))
+    sweep_ends = np.searchsorted(sorted_mins, maxs[order, sweep_axis], side="right")
+    pair_counts = np.maximum(sweep_ends - positions - 1, 0)
+    total_pairs = int(pair_counts.sum())
+    if total_pairs:
+        first_positions = np.repeat(positions, pair_counts)
+        pair_starts = np.cumsum(pair_counts) - pair_counts
+        offsets = np.arange(total_pairs) - np.repeat(pair_starts, pair_counts)
+        idx_a = order[first_positions]
+        idx_b = order[first_positions + 1 + offsets]
+
+        for axis in test_axes:
+            keep = np.nonzero(
+                (maxs[idx_a, axis] >= mins[idx_b, axis])
+                & (maxs[idx_b, axis] >= mins[idx_a, axis])
+            )[0]
+            idx_a = idx_a[keep]
+            idx_b = idx_b[keep]
+            if idx_a.size == 0:
+                break
+
+        for index_a, index_b in zip(idx_a.tolist(), idx_b.tolist()):
+            _union_groups(parent, index_a, index_b)
+
+    groups: dict[int, list[int]] = {}
+    for index in range(len(boxes)):
+        groups.setdefault(_find_group_root(parent, index), []).append(index)
+
+    return list(groups.values())
 
 
 def _get_selected_visible_face_islands(
     bm: bmesh.types.BMesh,
 ) -> list[list[bmesh.types.BMFace]]:
-    bm.faces.ensure_lookup_table()
-    visited: set[int] = set()
-    islands: list[list[bmesh.types.BMFace]] = []
+    faces = [
+        face for face in bm.faces if face.is_valid and face.select and not face.hide
+    ]
+    if not faces:
+        return []
+
+    bm.edges.index_update()
+    edge_counts = [len(face.edges) for face in faces]
+    edge_indices = np.fromiter(
+        (edge.index for face in faces for edge in face.edges),
+        dtype=np.int32,
+        count=sum(edge_counts),
+    )
+    owners = np.repeat(np.arange(len(faces), dtype=np.int32), edge_counts)
 
-    for face in bm.faces:
-        if not face.is_valid or not face.select or face.hide:
-            continue
-        if face.index in visited:
-            continue
+    order = np.argsort(edge_indices, kind="stable")
+    sorted_edges = edge_indices[order]
+    sorted_owners = owners[order]
+    shares_edge = sorted_edges[1:] == sorted_edges[:-1]
 
-        stack = [face]
-        island: list[bmesh.types.BMFace] = []
-        while stack:
-            current = stack.pop()
-            if current.index in visited or not current.is_valid:
-                continue
+    parent = list(range(len(faces)))
+    for owner_a, owner_b in zip(
+        sorted_owners[:-1][shares_edge].tolist(), sorted_owners[1:][shares_edge].tolist()
+    ):
+        _union_groups(parent, owner_a, owner_b)
+
+    islands: dict[int, list[bmesh.types.BMFace]] = {}
+    for position, face in enumerate(faces):
+        islands.setdefault(_find_group_root(parent, position), []).append(face)
 
-            visited.add(current.index)
-            island.append(current)
+    return list(islands.values())
 
-            for edge in current.edges:
-                for linked_face in edge.link_faces:
-                    if (
-                        linked_face.is_valid
-                        and linked_face.select
-                        and not linked_face.hide
-                        and linked_face.index not in visited
-                    ):
-                        stack.append(linked_face)
 
-        if island:
-            islands.append(island)
+def _shrink_fatten_vertices(
+    verts: list[bmesh.types.BMVert], distance: float
+) -> None:
+    for vert in verts:
+        vert.co += vert.normal * (distance * vert.calc_shell_factor())
 
-    return islands
+
+def _build_vertex_neighbors(
+    verts: list[bmesh.types.BMVert],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return each edge of ``verts`` as an owner row and a neighbour index.
+
+    Neighbours are identified by ``BMVert.index``, so the caller must have
+    run ``bm.verts.index_update()`` since the last topology change.
+    """
+
+    owners: list[int] = []
+    neighbors: list[int] = []
+    for row, vert in enumerate(verts):
+        for edge in vert.link_edges:
+            owners.append(row)
+            neighbors.append(edge.other_vert(vert).index)
+    return np.array(owners, dtype=np.int32), np.array(neighbors, dtype=np.int32)
+
+
+def _smooth_vertices(
+    bm: bmesh.types.BMesh,
+    verts: list[bmesh.types.BMVert],
+    vert_indices: np.ndarray,
+    *,
+    factor: float,
+    repeat: int,
+) -> None:
+    """Move ``verts`` towards the average of their neighbours like ``vertices_smooth``.
+
+    ``vert_indices`` must hold the current indices of ``verts``: the caller
+    runs ``bm.verts.index_update()`` and builds the vertex lookup table
+    first, since neighbour coordinates are read through ``bm.verts``.
+    """
+
+    owners, neighbors = _build_vertex_neighbors(verts)
+    if owners.size == 0:
+        return
+
+    local_indices = np.unique(np.concatenate((vert_indices, neighbors)))
+    coords = np.array(
+        [bm.verts[index].co for index in local_indices.tolist()], dtype=np.float64
+    )
+    own_rows = np.searchsorted(local_indices, vert_indices)
+    neighbor_rows = np.searchsorted(local_indices, neighbors)
+    degree = np.bincount(owners, minlength=len(verts)).astype(np.float64)
+    movable = degree > 0
+
+    for _ in range(repeat):
+        sums = np.zeros((len(verts), 3), dtype=np.float64)
+        np.add.at(sums, owners, coords[neighbor_rows])
+        own_coords = coords[own_rows]
+        averages = sums[movable] / degree[movable, None]
+        own_coords[movable] += factor * (averages - own_coords[movable])
+        coords[own_rows] = own_coords
+
+    for vert, coord in zip(verts, coords[own_rows].tolist()):
+        vert.co = coord
 
 
 def _try_shrink_fatten(
     mesh: bpy.types.Mesh,
     bm: bmesh.types.BMesh,
     faces: list[bmesh.types.BMFace],
+    bounding_box: tuple[Vector, Vector],
 ) -> bool:
     if not faces:
         return False
 
-    bm.faces.ensure_lookup_table()
+    # Faces and vertices are gathered by index below and looked up again
+    # through ``bm.verts``, so the indices have to be current.
+    bm.verts.index_update()
+    bm.faces.index_update()
     bm.verts.ensure_lookup_table()
 
-    group_face_indices = {face.index for face in faces if face.is_valid}
-    if not group_face_indices:
+    group_face_indices = np.unique(
+        np.fromiter((face.index for face in faces if face.is_valid), dtype=np.int32)
+    )
+    if group_face_indices.size == 0:
         return False
 
-    min_corner, max_corner = _calculate_faces_bounding_box(faces)
+    min_corner, max_corner = bounding_box
     extents = max_corner - min_corner
     max_length = max(extents.x, extents.y, extents.z)
     if max_length <= 0.0:
         return False
 
-    relevant_vertices = {
-        vert
-        for face in faces
-        if face.is_valid
-        for vert in face.verts
-        if vert.is_valid
-    }
-    if not relevant_vertices:
+    vert_indices = np.unique(
+        np.fromiter(
+            (vert.index for face in faces if face.is_valid for vert in face.verts),
+            dtype=np.int32,
+        )
+    )
+    if vert_indices.size == 0:
         return False
 
-    def _attempt(distance_value: float) -> bool:
-        saved_coords = {vert: vert.co.copy() for vert in relevant_vertices}
+    relevant_vertices = [bm.verts[index] for index in vert_indices.tolist()]
+    # Every failed attempt restores these, so all attempts start from the
+    # same coordinates and one snapshot serves them all.
+    saved_coords = np.array([vert.co for vert in relevant_vertices], dtype=np.float64)
+    saved_coord_list = saved_coords.tolist()
 
-        def _restore_saved_coords() -> None:
-            for vert, coord in saved_coords.items():
-                vert.co = coord
-            bm.normal_update()
-            bmesh.update_edit_mesh(mesh, loop_triangles=False, destructive=False)
+    def _restore_saved_coords() -> None:
+        for vert, coord in zip(relevant_vertices, saved_coord_list):
+            vert.co = coord
+        bm.normal_update()
+        bmesh.update_edit_mesh(mesh, loop_triangles=False, destructive=False)
 
-        bpy.ops.transform.shrink_fatten(value=distance_value, use_even_offset=True)
-        bpy.ops.mesh.vertices_smooth(factor=0.5, repeat=2)
+    def _attempt(distance_value: float) -> bool:
+        if _USE_BMESH_SHRINK_FATTEN:
+            # Only coordinates change between attempts, so the indices
+            # refreshed above stay valid for the smoothing lookups.
+            bm.normal_update()
+            _shrink_fatten_vertices(relevant_vertices, distance_value)
+            _smooth_vertices(bm, relevant_vertices, vert_indices, factor=0.5, repeat=2)
+        else:
+            bpy.ops.transform.shrink_fatten(value=distance_value, use_even_offset=True)
+            bpy.ops.mesh.vertices_smooth(factor=0.5, repeat=2)
 
         bm.normal_update()
         bmesh.update_edit_mesh(mesh, loop_triangles=False, destructive=False)
 
-        remaining = bmesh_get_intersecting_face_indices(bm)
-        if not (remaining & group_face_indices):
+        remaining = np.frombuffer(bmesh_get_intersecting_face_indices(bm), dtype=np.int32)
+        if not np.intersect1d(remaining, group_face_indices, assume_unique=True).size:
             return True
 
         _restore_saved_coords()
@@ -217,18 +338,29 @@ def _try_shrink_fatten(
     return False
 
 
+def _select_only_faces(
+    mesh: bpy.types.Mesh, faces: list[bmesh.types.BMFace]
+) -> bmesh.types.BMesh:
+    bpy.ops.mesh.select_all(action='DESELECT')
+    bm = bmesh.from_edit_mesh(mesh)
+    # ``select_set`` also selects the face's verts and edges, which the
+    # transform operators act on; flushing face flags would not.
+    for face in faces:
+        if face.is_valid:
+            face.select_set(True)
+    bmesh.update_edit_mesh(mesh, loop_triangles=False, destructive=False)
+    return bm
+
+
 def _test_shrink_fatten(
     obj, mesh: bpy.types.Mesh, bm: bmesh.types.BMesh
 ) -> bool:
     bpy.ops.mesh.select_mode(type="FACE")
 
     face_indices = bmesh_get_intersecting_face_indices(bm)
-    select_faces(face_indices, obj)
-    bmesh.update_edit_mesh(mesh, loop_triangles=False, destructive=False)
+    select_faces(face_indices, mesh, bm)
 
     _grow_selection(1)
-    get_bmesh(mesh)
-
     bpy.ops.mesh.hide(unselected=True)
 
     bm = bmesh.from_edit_mesh(mesh)
@@ -242,13 +374,10 @@ def _test_shrink_fatten(
     solved_any = False
     for group in grouped_indices:
         group_faces = [face for idx in group for face in islands[idx]]
-        bpy.ops.mesh.select_all(action='DESELECT')
-        for face in group_faces:
-            if face.is_valid:
-                face.select_set(True)
-        bm = get_bmesh(mesh)
+        group_box = _merge_bounding_boxes([bounding_boxes[idx] for idx in group])
+        bm = _select_only_faces(mesh, group_faces)
 
-        if _try_shrink_fatten(mesh, bm, group_faces):
+        if _try_shrink_fatten(mesh, bm, group_faces, group_box):
             solved_any = True
 
     bpy.ops.mesh.reveal()
@@ -257,22 +386,57 @@ def _test_shrink_fatten(
     return solved_any
 
 
-def _clean_mesh_intersections_wrapper(obj: bpy.types.Object, max_attempts: int) -> tuple[bool, bool]:
-    checksum_before = mesh_checksum_fast(obj)
+def _clean_mesh_intersections_wrapper(obj: bpy.types.Object, max_attempts: int) -> tuple[bool, int]:
+    verify_checksum = is_debug_output_enabled()
+    checksum_before = mesh_checksum_fast(obj) if verify_checksum else None
+    mutations_before = _mesh_mutation_count
+    needs_triangulation = not mesh_is_triangulated(obj.data)
+    face_indices = None
+    if not needs_triangulation:
+        # Polygon indices match the Edit mode face indices of an already
+        # triangulated mesh, so the first overlap test can reuse the tree a
+        # previous filter run left in the cache.
+        face_indices = mesh_get_intersecting_face_indices(obj.data)
+        if not face_indices:
+            return False, 0
+
     bpy.ops.object.mode_set(mode="EDIT")
-    clean = _clean_mesh_intersections(obj, max_attempts)
+    remaining = _clean_mesh_intersections(
+        obj, max_attempts, triangulate=needs_triangulation, face_indices=face_indices
+    )
     bpy.ops.object.mode_set(mode="OBJECT")
-    checksum_after = mesh_checksum_fast(obj)
-    changed = checksum_before != checksum_after
-    return changed, clean
+    changed = _mesh_mutation_count != mutations_before
+    if changed:
+        invalidate_mesh_bvh(obj.data)
+    if verify_checksum and changed != (mesh_checksum_fast(obj) != checksum_before):
+        log_debug(f"Mutation count disagrees with mesh checksum for {obj.name}")
+    return changed, remaining
+
+
+def _smooth_intersecting_faces(
+    face_indices: MutableSequence[int], mesh: bpy.types.Mesh, bm: bmesh.types.BMesh
+) -> None:
+    select_faces(face_indices, mesh, bm)
+    bpy.ops.mesh.select_more()
+    bpy.ops.mesh.select_more()
+    bpy.ops.mesh.select_less()
+    bpy.ops.mesh.vertices_smooth(factor=0.5, repeat=2)
+    _record_mesh_mutation()
 
 
 def _clean_mesh_intersections(
-    obj: bpy.types.Object, max_attempts: int
-) -> bool:
+    obj: bpy.types.Object,
+    max_attempts: int,
+    *,
+    triangulate: bool = True,
+    face_indices: MutableSequence[int] | None = None,
+) -> int:
     """Run the intersection smoothing workflow on a mesh object.
 
-    returns if the mesh still contains intersections.
+    Smoothing stops early once an attempt no longer reduces the number of
+    intersecting faces. ``face_indices`` may carry the intersecting faces
+    when the caller already knows them. Returns the number of intersecting
+    faces left.
     """
 
     bpy.ops.mesh.reveal(select=False)
@@ -280,29 +444,34 @@ def _clean_mesh_intersections(
     mesh = obj.data
     max_attempts = max(1, max_attempts)
     if mesh is None:
-        return True
+        return 0
+
+    if triangulate:
+        bm = get_bmesh(mesh)
+        _triangulate_bmesh(bm)
+        bmesh.update_edit_mesh(mesh, loop_triangles=False, destructive=True)
+        _record_mesh_mutation()
 
+    bpy.ops.mesh.select_mode(type="FACE")
     bm = get_bmesh(mesh)
-    _triangulate_bmesh(bm)
-    bmesh.update_edit_mesh(mesh, loop_triangles=False, destructive=True)
+    if face_indices is None or triangulate:
+        face_indices = bmesh_get_intersecting_face_indices(bm)
+    log_debug(f"Intersecting faces: {len(face_indices)}")
 
-    for iteration in range(1, max_attempts + 1):
-        bpy.ops.mesh.select_mode(type="FACE")
-        bm = get_bmesh(mesh)
-        face_indices = list(bmesh_get_intersecting_face_indices(bm))
-        print("num face indices", len(face_indices))
-        if len(face_indices) == 0:
-            return True
+    for _ in range(max_attempts):
+        if not face_indices:
+            break
 
-        select_faces(face_indices, mesh, bm)
-        bpy.ops.mesh.select_more()
-        bpy.ops.mesh.select_more()
-        bpy.ops.mesh.select_less()
-        bpy.ops.mesh.vertices_smooth(factor=0.5, repeat=2)
+        _smooth_intersecting_faces(face_indices, mesh, bm)
 
-    bm = get_bmesh(mesh)
-    face_indices = bmesh_get_intersecting_face_indices(bm)
-    return len(face_indices) == 0
+        previous_count = len(face_indices)
+        bm = get_bmesh(mesh)
+        face_indices = bmesh_get_intersecting_face_indices(bm)
+        log_debug(f"Intersecting faces: {len(face_indices)}")
+        if len(face_indices) >= previous_count:
+            break
+
+    return len(face_indices)
 
 
 class T4P_OT_smooth_intersections(ModalTimerMixin, Operator):
@@ -359,7 +528,7 @@ class T4P_OT_smooth_intersections(ModalTimerMixin, Operator):
         state.attempt_limit = self._resolve_attempt_limit()
         state.objects_to_process = self._collect_candidates(context)
 
-        bpy.ops.object.select_all(action="DESELECT")
+        deselect_objects(state.initial_selection)
 
         if not state.objects_to_process:
             return self._finish_modal(context, cancelled=False)
@@ -404,12 +573,17 @@ class T4P_OT_smooth_intersections(ModalTimerMixin, Operator):
         if state.scene is not None and state.scene.objects.get(obj.name) is None:
             return
 
+        if get_cached_self_intersection_count(obj) == 0:
+            return
+
         context.view_layer.objects.active = obj
         obj.select_set(True)
-        attempts = _clean_mesh_intersections_wrapper(obj, state.attempt_limit)
+        changed, remaining = _clean_mesh_intersections_wrapper(obj, state.attempt_limit)
         obj.select_set(False)
 
-        if attempts:
+        set_object_analysis_stats(obj, intersection_count=remaining)
+
+        if changed:
             state.smoothed_objects.append(obj.name)
 
     def _finish_modal(self, context: bpy.types.Context, *, cancelled: bool) -> set[str]:
@@ -423,15 +597,15 @@ class T4P_OT_smooth_intersections(ModalTimerMixin, Operator):
                 {"WARNING"},
                 "Intersection cleaning cancelled before completion.",
             )
-            _play_warning_sound(context)
+            _play_warning_sound_async()
             return {"CANCELLED"}
 
         remaining_intersections = self._has_remaining_intersections()
 
         if remaining_intersections:
-            _play_warning_sound(context)
+            _play_warning_sound_async()
         else:
-            _play_happy_sound(context)
+            _play_happy_sound_async()
 
         if not state.smoothed_objects:
             self.report({"INFO"}, "No intersecting faces were found.")
@@ -469,17 +643,14 @@ class T4P_OT_smooth_intersections(ModalTimerMixin, Operator):
             if scene is not None and scene.objects.get(obj.name) is None:
                 continue
 
-            bm_for_check = None
-            try:
-                bm_for_check = bmesh.new()
-                bm_for_check.from_mesh(obj.data)
-                if bmesh_get_intersecting_face_indices(bm_for_check):
+            cached_intersections = get_cached_self_intersection_count(obj)
+            if cached_intersections is not None:
+                if cached_intersections > 0:
                     return True
-            except RuntimeError:
                 continue
-            finally:
-                if bm_for_check is not None:
-                    bm_for_check.free()
+
+            if mesh_get_intersecting_face_indices(obj.data):
+                return True
 
         return False
 
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import time
+from collections import deque
 from dataclasses import dataclass, field
 
 import bmesh
 import bpy
+import numpy as np
 from bpy.types import Operator
 
 from ..audio import _play_happy_sound, _play_warning_sound
@@ -13,12 +16,18 @@ from ..debug import profile_module
 from ..main import (
     CLEAN_NON_MANIFOLD_OPERATOR_IDNAME,
     _triangulate_bmesh,
+    bmesh_count_non_manifold_verts,
     count_non_manifold_verts,
-    get_bmesh,
+    label_connected_components,
     mesh_checksum_fast,
     select_non_manifold_verts,
 )
-from .modal_utils import ModalTimerMixin
+from .modal_utils import (
+    ModalTimerMixin,
+    deselect_objects,
+    is_object_in_snapshot,
+    scene_object_pointers,
+)
 
 
 @dataclass
@@ -30,6 +39,7 @@ class _CleanNonManifoldState:
     initial_active: bpy.types.Object | None = None
     initial_selection: list[bpy.types.Object] = field(default_factory=list)
     scene: bpy.types.Scene | None = None
+    scene_pointers: set[int] | None = None
     num_candidates: int = 0
     num_fine: int = 0
     num_failed: int = 0
@@ -53,134 +63,129 @@ def _clean_object_non_manifold(
     bpy.ops.mesh.select_all(action="SELECT")
     bpy.ops.mesh.reveal()
 
-    bm = get_bmesh(mesh)
-    _triangulate_bmesh(bm)
-    num_errors_before = count_non_manifold_verts(bm)
-    bmesh.update_edit_mesh(mesh, loop_triangles=False, destructive=True)
-
-    bpy.ops.mesh.delete_loose()
-    _delete_interior_faces()
-    _fill_holes()
-
-    bm = get_bmesh(mesh)
-    _delete_small_vertex_islands(bm, min_vertices=delete_island_threshold)
-    _dissolve_degenerate_and_triangulate(bm, threshold=merge_distance)
+    # The edit-mode operators below work on this same BMesh in place, so it
+    # is acquired once and only written back to the mesh at the end.
+    bm = bmesh.from_edit_mesh(mesh)
+
+    # Every step reports whether it edited the mesh; the checksum is only
+    # needed when none did, since recalculating normals reports nothing.
+    dirty = _triangulate_bmesh(bm)
+    num_errors_before = bmesh_count_non_manifold_verts(bm)
+
+    dirty |= _delete_interior_faces(bm)
+    dirty |= _delete_loose(bm)
+    dirty |= _fill_and_triangulate_holes(bm)
+    dirty |= _delete_small_vertex_islands(bm, min_vertices=delete_island_threshold)
+    dirty |= _dissolve_degenerate_and_triangulate(bm, threshold=merge_distance)
+    dirty |= _remove_doubles(bm, merge_distance)
     bm.normal_update()
-    bmesh.update_edit_mesh(mesh, loop_triangles=False, destructive=True)
 
-    _remove_doubles(merge_distance)
-    _make_manifold(mesh)
-    _unify_normals()
+    dirty |= _make_manifold(bm)
 
-    bm = get_bmesh(mesh)
-    num_errors_after = count_non_manifold_verts(bm)
+    _unify_normals(bm)
+    num_errors_after = bmesh_count_non_manifold_verts(bm)
+    bmesh.update_edit_mesh(mesh, loop_triangles=False, destructive=True)
     clean = num_errors_after == 0
     worse = num_errors_after > num_errors_before
 
     bpy.ops.object.mode_set(mode="OBJECT")
 
-    checksum_after = mesh_checksum_fast(obj)
-    changed = checksum_after != checksum_before
+    changed = dirty or mesh_checksum_fast(obj) != checksum_before
 
     print("Stats: before", num_errors_before, "after", num_errors_after, "clean", clean, "changed", changed, "worse", worse)
 
     return changed, clean, worse
 
 
-def _unify_normals():
+def _unify_normals(bm: bmesh.types.BMesh) -> None:
     """have all normals face outwards"""
-    bpy.ops.mesh.select_all(action="SELECT")
-    bpy.ops.mesh.normals_make_consistent()
+    bmesh.ops.recalc_face_normals(bm, faces=bm.faces[:])
 
 
-def _remove_doubles(merge_distance):
-    bpy.ops.mesh.select_all(action="SELECT")
-    bpy.ops.mesh.remove_doubles(threshold=merge_distance)
+def _remove_doubles(bm: bmesh.types.BMesh, merge_distance: float) -> bool:
+    num_verts = len(bm.verts)
+    bmesh.ops.remove_doubles(bm, verts=bm.verts[:], dist=merge_distance)
+    return len(bm.verts) != num_verts
+
+
+def _delete_loose(bm: bmesh.types.BMesh) -> bool:
+    """Delete wire edges and vertices without any edges."""
+    loose_edges = [edge for edge in bm.edges if edge.is_wire]
+    if loose_edges:
+        bmesh.ops.delete(bm, geom=loose_edges, context="EDGES")
+    loose_verts = [vert for vert in bm.verts if not vert.link_edges]
+    if loose_verts:
+        bmesh.ops.delete(bm, geom=loose_verts, context="VERTS")
+    return bool(loose_edges or loose_verts)
+
 
+def _make_manifold(bm: bmesh.types.BMesh) -> bool:
+    # Resolve the operators once; each ``bpy.ops.mesh.*`` access walks the
+    # operator registry.
+    select_all = bpy.ops.mesh.select_all
+    fill_holes = bpy.ops.mesh.fill_holes
+    delete = bpy.ops.mesh.delete
 
-def _make_manifold(mesh):
-    bm = get_bmesh(mesh)
     fix_non_manifold = count_non_manifold_verts(bm) > 0
+    # ``fill_holes`` never adds vertices, so any deletion shows up in the
+    # vertex count and any fill in the face count.
+    counts_before = (len(bm.verts), len(bm.edges), len(bm.faces))
     num_faces = len(bm.faces)
     while fix_non_manifold:
-        _try_fix_manifold()
-        bm = get_bmesh(mesh)
+        select_all(action="SELECT")
+        fill_holes(sides=0)
+        select_non_manifold_verts(use_wire=True, use_verts=True)
+        delete(type="VERT")
+
         new_num_faces = len(bm.faces)
         if new_num_faces == num_faces:
             fix_non_manifold = False
         else:
             num_faces = new_num_faces
+    return (len(bm.verts), len(bm.edges), len(bm.faces)) != counts_before
 
 
-def _try_fix_manifold():
-    bpy.ops.mesh.select_all(action="SELECT")
-    bpy.ops.mesh.fill_holes(sides=0)
-    select_non_manifold_verts(use_wire=True, use_verts=True)
-    bpy.ops.mesh.delete(type="VERT")
-
-
-def _fill_holes():
-    bpy.ops.mesh.select_all(action="SELECT")
-    bpy.ops.mesh.fill_holes(sides=0)
-
-
-def _get_mesh_vertex_islands(
-        bm: bmesh.types.BMesh,
-) -> list[list[bmesh.types.BMVert]]:
-    bm.verts.ensure_lookup_table()
-    visited: set[int] = set()
-    islands: list[list[bmesh.types.BMVert]] = []
-
-    for vert in bm.verts:
-        if not vert.is_valid:
-            continue
-        if vert.index in visited:
-            continue
-
-        stack = [vert]
-        island: list[bmesh.types.BMVert] = []
-        while stack:
-            current = stack.pop()
-            if not current.is_valid:
-                continue
-
-            index = current.index
-            if index in visited:
-                continue
-
-            visited.add(index)
-            island.append(current)
-
-            for edge in current.link_edges:
-                if not edge.is_valid:
-                    continue
-                for linked_vert in edge.verts:
-                    if linked_vert.is_valid and linked_vert.index not in visited:
-                        stack.append(linked_vert)
-
-        if island:
-            islands.append(island)
+def _get_vertex_component_labels(bm: bmesh.types.BMesh) -> np.ndarray:
+    """Return the island label of every vertex in ``bm``, by vertex index."""
 
-    return islands
+    bm.verts.index_update()
+    edge_count = len(bm.edges)
+    edge_verts = np.fromiter(
+        (vert.index for edge in bm.edges for vert in edge.verts),
+        dtype=np.int32,
+        count=edge_count * 2,
+    )
+    return label_connected_components(
+        len(bm.verts), edge_verts[0::2], edge_verts[1::2]
+    )
 
 
 def _delete_small_vertex_islands(
         bm: bmesh.types.BMesh, min_vertices: int
-) -> None:
-    islands = _get_mesh_vertex_islands(bm)
-    if not islands:
-        return
-
-    max_size = max(len(island) for island in islands)
-    verts_to_delete: set[bmesh.types.BMVert] = set()
-    for island in islands:
-        if len(island) < min_vertices and len(island) < max_size:
-            verts_to_delete.update(island)
-
-    if not verts_to_delete:
+) -> bool:
+    if len(bm.verts) == 0:
+        return False
+
+    # Island sizes are counted per label, so no island is ever gathered
+    # into its own list just to be measured.
+    labels = _get_vertex_component_labels(bm)
+    # Labels are the lowest vertex index of each island, so a mesh that is
+    # a single island is labelled all zero and has nothing to delete.
+    if not labels.any():
+        return False
+
+    island_sizes = np.bincount(labels)
+    vertex_island_sizes = island_sizes[labels]
+    small = (vertex_island_sizes < min_vertices) & (
+        vertex_island_sizes < island_sizes.max()
+    )
+    small_indices = np.flatnonzero(small)
+    if small_indices.size == 0:
         return False
 
-    bmesh.ops.delete(bm, geom=list(verts_to_delete), context="VERTS")
+    bm.verts.ensure_lookup_table()
+    verts_to_delete = [bm.verts[index] for index in small_indices.tolist()]
+    bmesh.ops.delete(bm, geom=verts_to_delete, context="VERTS")
     return True
 
 
@@ -190,48 +195,58 @@ def _fill_non_manifold(sides: int):
     bpy.ops.mesh.fill_holes(sides=sides)
 
 
-def _delete_interior_faces() -> None:
+def _delete_interior_faces(bm: bmesh.types.BMesh) -> bool:
     """Delete interior faces in edit mode.
+
+    Blender's region-based selection finds whole interior walls, including
+    ones split into several triangles; it selects on the same edit BMesh, so
+    the selected faces are deleted from ``bm`` directly.
     """
     bpy.ops.mesh.select_all(action="DESELECT")
     bpy.ops.mesh.select_interior_faces()
-    bpy.ops.mesh.delete(type="FACE")
+    interior_faces = [face for face in bm.faces if face.select]
+    if not interior_faces:
+        return False
+
+    bmesh.ops.delete(bm, geom=interior_faces, context="FACES")
+    return True
 
 
-def _fill_and_triangulate_holes(bm: bmesh.types.BMesh) -> None:
-    bm.edges.ensure_lookup_table()
-    boundary_edges = [edge for edge in bm.edges if edge.is_valid and edge.is_boundary]
+def _fill_and_triangulate_holes(bm: bmesh.types.BMesh) -> bool:
+    boundary_edges = [edge for edge in bm.edges if edge.is_boundary]
     if not boundary_edges:
-        return
+        return False
 
     result = bmesh.ops.holes_fill(bm, edges=boundary_edges, sides=0)
-    new_faces = [face for face in result.get("faces", []) if face.is_valid]
+    new_faces = result.get("faces", [])
     if not new_faces:
-        return
+        return False
 
     bmesh.ops.triangulate(bm, faces=new_faces)
-    return
+    return True
 
 
 def _dissolve_degenerate_and_triangulate(
         bm: bmesh.types.BMesh, threshold: float
 ) -> bool:
-    edges = [edge for edge in bm.edges if edge.is_valid]
+    edges = bm.edges[:]
     if not edges:
         return False
 
+    num_edges = len(edges)
     dissolve_result = bmesh.ops.dissolve_degenerate(
         bm, edges=edges, dist=threshold
     )
     # ``bmesh.ops.dissolve_degenerate`` may return ``None`` in some edge cases.
     result_get = getattr(dissolve_result, "get", None)
     if result_get is None:
-        changed = False
+        changed = len(bm.edges) != num_edges
     else:
         changed = bool(
             result_get("region_edges")
             or result_get("region_faces")
             or result_get("region_verts")
+            or len(bm.edges) != num_edges
         )
 
     triangulated = _triangulate_bmesh(bm)
@@ -245,28 +260,30 @@ def get_bmesh_islands(bm: bmesh.types.BMesh):
 
     Two faces are considered connected if they share an edge.
     """
-    bm.faces.ensure_lookup_table()
-    bm.edges.ensure_lookup_table()
-
-    for f in bm.faces:
-        f.tag = False  # unvisited
+    # BMesh has no bulk tag writer, so visits are tracked by face index in a
+    # zeroed buffer instead of clearing every face tag in Python first.
+    bm.faces.index_update()
+    visited = bytearray(len(bm.faces))
 
     islands = []
     for f in bm.faces:
-        if f.tag:
+        if visited[f.index]:
             continue
         island = []
         q = deque([f])
-        f.tag = True
+        visited[f.index] = 1
 
+        popleft = q.popleft
+        append = q.append
         while q:
-            cur = q.popleft()
+            cur = popleft()
             island.append(cur)
             for e in cur.edges:
                 for nf in e.link_faces:
-                    if not nf.tag:
-                        nf.tag = True
-                        q.append(nf)
+                    index = nf.index
+                    if not visited[index]:
+                        visited[index] = 1
+                        append(nf)
 
         islands.append(island)
 
@@ -300,13 +317,17 @@ class T4P_OT_clean_non_manifold(ModalTimerMixin, Operator):
             return {"RUNNING_MODAL"}
 
         state = self._state
-        if state.current_index >= len(state.objects_to_process):
-            return self._finish_modal(context, cancelled=False)
+        objects = state.objects_to_process
+        deadline = self._modal_tick_deadline()
+        while state.current_index < len(objects):
+            self._process_object(context, objects[state.current_index])
+            state.current_index += 1
+            if time.perf_counter() >= deadline:
+                break
 
-        obj = state.objects_to_process[state.current_index]
-        self._process_object(context, obj)
-        state.current_index += 1
         self._update_modal_progress(state.current_index)
+        if state.current_index >= len(objects):
+            return self._finish_modal(context, cancelled=False)
         return {"RUNNING_MODAL"}
 
     def _begin(self, context: bpy.types.Context):
@@ -324,19 +345,17 @@ class T4P_OT_clean_non_manifold(ModalTimerMixin, Operator):
 
         state.initial_active = context.view_layer.objects.active
         state.scene = context.scene
+        state.scene_pointers = scene_object_pointers(state.scene)
         state.objects_to_process = [
             obj
             for obj in state.initial_selection
             if obj.type == "MESH"
             and obj.data is not None
-            and (
-                state.scene is None
-                or state.scene.objects.get(obj.name) is not None
-            )
+            and is_object_in_snapshot(obj, state.scene_pointers)
         ]
         state.num_candidates = len(state.objects_to_process)
 
-        bpy.ops.object.select_all(action="DESELECT")
+        deselect_objects(state.initial_selection)
 
         if not state.objects_to_process:
             return self._finish_modal(context, cancelled=False)
@@ -350,6 +369,7 @@ class T4P_OT_clean_non_manifold(ModalTimerMixin, Operator):
         state.initial_active = None
         state.initial_selection.clear()
         state.scene = None
+        state.scene_pointers = None
         state.num_candidates = 0
         state.num_fine = 0
         state.num_failed = 0
@@ -358,9 +378,6 @@ class T4P_OT_clean_non_manifold(ModalTimerMixin, Operator):
 
     def _process_object(self, context: bpy.types.Context, obj: bpy.types.Object) -> None:
         state = self._state
-        if state.scene is not None and state.scene.objects.get(obj.name) is None:
-            return
-
         context.view_layer.objects.active = obj
         obj.select_set(True)
 
@@ -399,9 +416,8 @@ class T4P_OT_clean_non_manifold(ModalTimerMixin, Operator):
             context.view_layer.objects.active = None
             return
 
-        scene = state.scene
         for obj in state.initial_selection:
-            if scene is not None and scene.objects.get(obj.name) is None:
+            if not is_object_in_snapshot(obj, state.scene_pointers):
                 continue
             obj.select_set(True)
 
@@ -409,10 +425,9 @@ class T4P_OT_clean_non_manifold(ModalTimerMixin, Operator):
 
     def _restore_active_object(self, context: bpy.types.Context) -> None:
         state = self._state
-        scene = state.scene
         if (
             state.initial_active
-            and (scene is None or scene.objects.get(state.initial_active.name) is not None)
+            and is_object_in_snapshot(state.initial_active, state.scene_pointers)
         ):
             context.view_layer.objects.active = state.initial_active
         else:
@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass, field
 
-import bmesh
 import bpy
 from bpy.types import Operator
 
@@ -12,11 +12,16 @@ from ..audio import _play_happy_sound, _play_warning_sound
 from ..debug import profile_module
 from ..main import (
     FILTER_OPERATOR_IDNAME,
-    bmesh_get_intersecting_face_indices,
     get_cached_self_intersection_count,
+    mesh_get_intersecting_face_indices,
     set_object_analysis_stats,
 )
-from .modal_utils import ModalTimerMixin
+from .modal_utils import (
+    ModalTimerMixin,
+    deselect_objects,
+    is_object_in_snapshot,
+    scene_object_pointers,
+)
 
 
 @dataclass
@@ -30,6 +35,7 @@ class _FilterIntersectionsState:
     objects_with_intersections: list[bpy.types.Object] = field(default_factory=list)
     mesh_candidates: int = 0
     scene: bpy.types.Scene | None = None
+    scene_pointers: set[int] | None = None
 
 
 class T4P_OT_filter_intersections(ModalTimerMixin, Operator):
@@ -60,13 +66,21 @@ class T4P_OT_filter_intersections(ModalTimerMixin, Operator):
             return {"RUNNING_MODAL"}
 
         state = self._state
-        if state.current_index >= len(state.objects_to_process):
-            return self._finish_modal(context, cancelled=False)
+        # Validating a cached count hashes the whole mesh, so cached objects
+        # spend the tick budget just like the ones that need an overlap test.
+        objects = state.objects_to_process
+        deadline = self._modal_tick_deadline()
+        while state.current_index < len(objects):
+            obj = objects[state.current_index]
+            state.current_index += 1
+            if not self._process_cached_object(obj):
+                self._process_uncached_object(obj)
+            if time.perf_counter() >= deadline:
+                break
 
-        obj = state.objects_to_process[state.current_index]
-        self._process_object(context, obj)
-        state.current_index += 1
         self._update_modal_progress(state.current_index)
+        if state.current_index >= len(objects):
+            return self._finish_modal(context, cancelled=False)
         return {"RUNNING_MODAL"}
 
     def _begin(self, context: bpy.types.Context):
@@ -84,12 +98,19 @@ class T4P_OT_filter_intersections(ModalTimerMixin, Operator):
 
         state.initial_active = context.view_layer.objects.active
         state.initial_selection = selected_objects
-        state.objects_to_process = selected_objects
         state.scene = context.scene
+        state.scene_pointers = scene_object_pointers(state.scene)
+        state.objects_to_process = [
+            obj
+            for obj in selected_objects
+            if obj.type == "MESH"
+            and obj.data is not None
+            and is_object_in_snapshot(obj, state.scene_pointers)
+        ]
 
-        bpy.ops.object.select_all(action="DESELECT")
+        deselect_objects(selected_objects)
 
-        return self._start_modal(context, len(selected_objects))
+        return self._start_modal(context, len(state.objects_to_process))
 
     def _reset_state(self) -> None:
         state = self._state
@@ -100,41 +121,32 @@ class T4P_OT_filter_intersections(ModalTimerMixin, Operator):
         state.objects_with_intersections.clear()
         state.mesh_candidates = 0
         state.scene = None
+        state.scene_pointers = None
+
+    def _process_cached_object(self, obj: bpy.types.Object) -> bool:
+        """Handle ``obj`` from its cached count without an overlap test.
+
+        Returns ``False`` when the object still needs an intersection check.
+        """
 
-    def _process_object(self, context: bpy.types.Context, obj: bpy.types.Object) -> None:
         state = self._state
-        if obj.type != "MESH" or obj.data is None:
-            return
+        cached_intersections = get_cached_self_intersection_count(obj)
+        if cached_intersections is None:
+            return False
 
-        if state.scene is not None and state.scene.objects.get(obj.name) is None:
-            return
+        state.mesh_candidates += 1
+        if cached_intersections > 0:
+            state.objects_with_intersections.append(obj)
+        return True
 
+    def _process_uncached_object(self, obj: bpy.types.Object) -> None:
+        state = self._state
         state.mesh_candidates += 1
-        cached_intersections = get_cached_self_intersection_count(obj)
-        if cached_intersections is not None:
-            if cached_intersections > 0:
-                state.objects_with_intersections.append(obj)
-            return
-
-        context.view_layer.objects.active = obj
-        obj.select_set(True)
-
-        try:
-            bpy.ops.object.mode_set(mode="EDIT")
-        except RuntimeError:
-            obj.select_set(False)
-            return
-
-        bm = bmesh.from_edit_mesh(obj.data)
-        bm.verts.ensure_lookup_table()
-        bm.faces.ensure_lookup_table()
-        bm.edges.ensure_lookup_table()
-
-        face_indices = bmesh_get_intersecting_face_indices(bm)
-        intersection_count = len(face_indices)
 
-        bpy.ops.object.mode_set(mode="OBJECT")
-        obj.select_set(False)
+        # The mesh data is current in Object mode, so the overlap test reads
+        # its arrays directly without building a BMesh or entering Edit mode.
+        face_indices = mesh_get_intersecting_face_indices(obj.data)
+        intersection_count = len(face_indices)
 
         set_object_analysis_stats(obj, intersection_count=intersection_count)
 
@@ -181,14 +193,14 @@ class T4P_OT_filter_intersections(ModalTimerMixin, Operator):
         state = self._state
 
         for obj in state.initial_selection:
-            if state.scene is not None and state.scene.objects.get(obj.name) is None:
+            if not is_object_in_snapshot(obj, state.scene_pointers):
                 continue
             obj.select_set(True)
 
         if (
             state.initial_active
             and state.scene is not None
-            and state.scene.objects.get(state.initial_active.name) is not None
+            and is_object_in_snapshot(state.initial_active, state.scene_pointers)
         ):
             context.view_layer.objects.active = state.initial_active
         else:
@@ -196,11 +208,10 @@ class T4P_OT_filter_intersections(ModalTimerMixin, Operator):
 
     def _determine_new_active(self) -> bpy.types.Object | None:
         state = self._state
-        if (
-            state.initial_active
-            and state.initial_active in state.objects_with_intersections
-        ):
-            return state.initial_active
+        if state.initial_active:
+            hit_pointers = {obj.as_pointer() for obj in state.objects_with_intersections}
+            if state.initial_active.as_pointer() in hit_pointers:
+                return state.initial_active
         if state.objects_with_intersections:
             return state.objects_with_intersections[0]
         return None
@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass, field
 
-import bmesh
 import bpy
 from bpy.types import Operator
 
@@ -12,12 +12,16 @@ from ..audio import _play_happy_sound, _play_warning_sound
 from ..debug import profile_module
 from ..main import (
     FILTER_NON_MANIFOLD_OPERATOR_IDNAME,
-    count_non_manifold_verts,
-    get_bmesh,
     get_cached_non_manifold_count,
+    mesh_count_non_manifold_verts,
     set_object_analysis_stats,
 )
-from .modal_utils import ModalTimerMixin
+from .modal_utils import (
+    ModalTimerMixin,
+    deselect_objects,
+    is_object_in_snapshot,
+    scene_object_pointers,
+)
 
 
 @dataclass
@@ -31,6 +35,7 @@ class _FilterNonManifoldState:
     non_manifold_objects: list[bpy.types.Object] = field(default_factory=list)
     mesh_candidates: int = 0
     scene: bpy.types.Scene | None = None
+    scene_pointers: set[int] | None = None
 
 
 class T4P_OT_filter_non_manifold(ModalTimerMixin, Operator):
@@ -61,13 +66,21 @@ class T4P_OT_filter_non_manifold(ModalTimerMixin, Operator):
             return {"RUNNING_MODAL"}
 
         state = self._state
-        if state.current_index >= len(state.objects_to_process):
-            return self._finish_modal(context, cancelled=False)
+        # Counting reads mesh arrays without leaving Object mode, so a tick
+        # keeps going until its time budget is spent instead of handling a
+        # single object.
+        objects = state.objects_to_process
+        deadline = self._modal_tick_deadline()
+        while state.current_index < len(objects):
+            obj = objects[state.current_index]
+            state.current_index += 1
+            self._process_object(context, obj)
+            if time.perf_counter() >= deadline:
+                break
 
-        obj = state.objects_to_process[state.current_index]
-        self._process_object(context, obj)
-        state.current_index += 1
         self._update_modal_progress(state.current_index)
+        if state.current_index >= len(objects):
+            return self._finish_modal(context, cancelled=False)
         return {"RUNNING_MODAL"}
 
     def _begin(self, context: bpy.types.Context):
@@ -85,12 +98,19 @@ class T4P_OT_filter_non_manifold(ModalTimerMixin, Operator):
 
         state.initial_active = context.view_layer.objects.active
         state.initial_selection = selected_objects
-        state.objects_to_process = selected_objects
         state.scene = context.scene
+        state.scene_pointers = scene_object_pointers(state.scene)
+        state.objects_to_process = [
+            obj
+            for obj in selected_objects
+            if obj.type == "MESH"
+            and obj.data is not None
+            and is_object_in_snapshot(obj, state.scene_pointers)
+        ]
 
-        bpy.ops.object.select_all(action="DESELECT")
+        deselect_objects(selected_objects)
 
-        return self._start_modal(context, len(selected_objects))
+        return self._start_modal(context, len(state.objects_to_process))
 
     def _reset_state(self) -> None:
         state = self._state
@@ -101,15 +121,10 @@ class T4P_OT_filter_non_manifold(ModalTimerMixin, Operator):
         state.non_manifold_objects.clear()
         state.mesh_candidates = 0
         state.scene = None
+        state.scene_pointers = None
 
     def _process_object(self, context: bpy.types.Context, obj: bpy.types.Object) -> None:
         state = self._state
-        if obj.type != "MESH" or obj.data is None:
-            return
-
-        if state.scene is not None and state.scene.objects.get(obj.name) is None:
-            return
-
         state.mesh_candidates += 1
         cached_count = get_cached_non_manifold_count(obj)
         if cached_count is not None:
@@ -117,20 +132,9 @@ class T4P_OT_filter_non_manifold(ModalTimerMixin, Operator):
                 state.non_manifold_objects.append(obj)
             return
 
-        context.view_layer.objects.active = obj
-        obj.select_set(True)
-
-        try:
-            bpy.ops.object.mode_set(mode="EDIT")
-        except RuntimeError:
-            obj.select_set(False)
-            return
-
-        bm = get_bmesh(obj.data)
-        non_manifold_count = count_non_manifold_verts(bm)
-
-        bpy.ops.object.mode_set(mode="OBJECT")
-        obj.select_set(False)
+        # Count from the Object mode mesh arrays so the object never has to
+        # enter Edit mode and no BMesh has to be built.
+        non_manifold_count = mesh_count_non_manifold_verts(obj.data)
 
         set_object_analysis_stats(obj, non_manifold_count=non_manifold_count)
 
@@ -153,8 +157,9 @@ class T4P_OT_filter_non_manifold(ModalTimerMixin, Operator):
         for obj in state.non_manifold_objects:
             obj.select_set(True)
 
-        remaining_selected = [obj for obj in state.non_manifold_objects if obj.select_get()]
-        self._assign_new_active(context, remaining_selected)
+        # The queue only holds objects that were in the scene, so every object
+        # selected above is still selected; no select_get pass is needed.
+        self._assign_new_active(context, state.non_manifold_objects)
 
         if state.mesh_candidates == 0:
             self.report({"INFO"}, "No mesh objects selected.")
@@ -179,14 +184,14 @@ class T4P_OT_filter_non_manifold(ModalTimerMixin, Operator):
         state = self._state
 
         for obj in state.initial_selection:
-            if state.scene is not None and state.scene.objects.get(obj.name) is None:
+            if not is_object_in_snapshot(obj, state.scene_pointers):
                 continue
             obj.select_set(True)
 
         if (
             state.initial_active
             and state.scene is not None
-            and state.scene.objects.get(state.initial_active.name) is not None
+            and is_object_in_snapshot(state.initial_active, state.scene_pointers)
         ):
             context.view_layer.objects.active = state.initial_active
         else:
@@ -199,8 +204,9 @@ class T4P_OT_filter_non_manifold(ModalTimerMixin, Operator):
         if (
             state.initial_active
             and state.scene is not None
-            and state.scene.objects.get(state.initial_active.name) is not None
-            and state.initial_active in remaining_selected
+            and is_object_in_snapshot(state.initial_active, state.scene_pointers)
+            and state.initial_active.as_pointer()
+            in {obj.as_pointer() for obj in remaining_selected}
         ):
             context.view_layer.objects.active = state.initial_active
         elif remaining_selected:
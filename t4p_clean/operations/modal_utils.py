@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import time
 from contextlib import AbstractContextManager
 
 import bpy
@@ -15,6 +16,40 @@ from ..main import (
 )
 
 
+# Wall-clock time a modal timer tick may spend processing objects before it
+# yields back to the event loop.
+MODAL_TICK_BUDGET_SECONDS = 0.05
+
+
+def scene_object_pointers(scene: bpy.types.Scene | None) -> set[int] | None:
+    """Snapshot the objects linked to ``scene`` as a set of pointers.
+
+    Returns ``None`` when there is no scene to check against.
+    """
+
+    if scene is None:
+        return None
+    return {obj.as_pointer() for obj in scene.objects}
+
+
+def is_object_in_snapshot(
+    obj: bpy.types.Object, pointers: set[int] | None
+) -> bool:
+    """Return ``True`` when ``obj`` was in the scene snapshot ``pointers``."""
+
+    return pointers is None or obj.as_pointer() in pointers
+
+
+def deselect_objects(objects: list[bpy.types.Object]) -> None:
+    """Deselect ``objects`` without dispatching ``object.select_all``.
+
+    Pass the current selection to clear it; only those objects are touched.
+    """
+
+    for obj in objects:
+        obj.select_set(False)
+
+
 class ModalTimerMixin:
     """Provide helpers for running long operations as modal timers."""
 
@@ -44,6 +79,11 @@ class ModalTimerMixin:
 
         return {"RUNNING_MODAL"}
 
+    def _modal_tick_deadline(self) -> float:
+        """Return the ``time.perf_counter`` value at which a tick should yield."""
+
+        return time.perf_counter() + MODAL_TICK_BUDGET_SECONDS
+
     def _update_modal_progress(self, current_item: int) -> None:
         """Update the progress indicator when active."""
 
@@ -68,4 +108,10 @@ class ModalTimerMixin:
         self._modal_ui_manager = None
 
 
-__all__ = ("ModalTimerMixin",)
+__all__ = (
+    "MODAL_TICK_BUDGET_SECONDS",
+    "ModalTimerMixin",
+    "deselect_objects",
+    "is_object_in_snapshot",
+    "scene_object_pointers",
+)
@@ -4,8 +4,8 @@ from __future__ import annotations
 
 import bmesh
 import bpy
+import numpy as np
 from bpy.types import Operator
-from mathutils import Vector
 
 from ..debug import profile_module
 from ..main import (
@@ -20,19 +20,16 @@ from ..main import (
 
 
 def _select_faces_by_index(bm: bmesh.types.BMesh, indices: list[int]) -> int:
+    # Callers reveal the whole mesh first, so the faces need no unhiding.
     bm.faces.ensure_lookup_table()
-    selected = 0
+    faces = bm.faces
+    valid = np.asarray(indices, dtype=np.int64)
+    valid = valid[(valid >= 0) & (valid < len(faces))]
 
-    for index in indices:
-        if index < 0 or index >= len(bm.faces):
-            continue
+    for index in valid.tolist():
+        faces[index].select_set(True)
 
-        face = bm.faces[index]
-        face.hide_set(False)
-        face.select_set(True)
-        selected += 1
-
-    return selected
+    return int(valid.size)
 
 
 class T4P_OT_select_intersections(Operator):
@@ -51,19 +48,18 @@ class T4P_OT_select_intersections(Operator):
 
         mesh = editable_object.data
         bm = bmesh.from_edit_mesh(mesh)
-        bm.faces.ensure_lookup_table()
 
         face_indices = list(bmesh_get_intersecting_face_indices(bm))
         intersection_count = len(face_indices)
         set_object_analysis_stats(editable_object, intersection_count=intersection_count)
 
         if not face_indices:
-            bmesh.update_edit_mesh(mesh)
+            bmesh.update_edit_mesh(mesh, loop_triangles=False, destructive=False)
             self.report({"INFO"}, "No self-intersections detected.")
             return {"FINISHED"}
 
         selected = _select_faces_by_index(bm, face_indices)
-        bmesh.update_edit_mesh(mesh)
+        bmesh.update_edit_mesh(mesh, loop_triangles=False, destructive=False)
 
         self.report({"INFO"}, f"Selected {selected} intersecting faces.")
         return {"FINISHED"}
@@ -96,7 +92,6 @@ class T4P_OT_focus_intersections(Operator):
 
         mesh = editable_object.data
         bm = bmesh.from_edit_mesh(mesh)
-        bm.faces.ensure_lookup_table()
 
         face_indices = list(bmesh_get_intersecting_face_indices(bm))
         intersection_count = len(face_indices)
@@ -111,7 +106,7 @@ class T4P_OT_focus_intersections(Operator):
         focus_view_on_selected_faces(context)
 
         select_faces(face_indices, mesh, bm)
-        bmesh.update_edit_mesh(mesh)
+        bmesh.update_edit_mesh(mesh, loop_triangles=False, destructive=False)
 
         return {"FINISHED"}
 
@@ -5,16 +5,12 @@ from __future__ import annotations
 import bmesh
 import bpy
 from bpy.types import Operator
-from mathutils import Vector
 
 from ..debug import profile_module
 from ..main import (
     FOCUS_NON_MANIFOLD_OPERATOR_IDNAME,
     SELECT_NON_MANIFOLD_OPERATOR_IDNAME,
     select_non_manifold_verts,
-    select_faces,
-    select_edge,
-    select_verts,
     get_bmesh,
     focus_view_on_selected_faces,
     get_selected_faces,
@@ -25,43 +21,37 @@ from ..main import (
 
 
 def _select_faces_linked_to_selection(bm: bmesh.types.BMesh) -> int:
-    bm.faces.ensure_lookup_table()
-    visited: set[int] = set()
+    # Visits are tracked by face index in a flat buffer, which avoids hashing
+    # every index into a set.
+    bm.faces.index_update()
+    visited = bytearray(len(bm.faces))
+    selected = 0
 
     for edge in bm.edges:
         if not edge.select:
             continue
 
         for face in edge.link_faces:
-            if face.index in visited:
+            if visited[face.index]:
                 continue
             face.select_set(True)
             face.hide_set(False)
-            visited.add(face.index)
+            visited[face.index] = 1
+            selected += 1
 
     for vert in bm.verts:
         if not vert.select:
             continue
 
         for face in vert.link_faces:
-            if face.index in visited:
+            if visited[face.index]:
                 continue
             face.select_set(True)
             face.hide_set(False)
-            visited.add(face.index)
+            visited[face.index] = 1
+            selected += 1
 
-    return len(visited)
-
-
-def _first_selected_face_center(bm: bmesh.types.BMesh) -> Vector | None:
-    bm.faces.ensure_lookup_table()
-
-    for face in bm.faces:
-        if face.select:
-            bm.faces.active = face
-            return face.calc_center_median()
-
-    return None
+    return selected
 
 
 class T4P_OT_select_non_manifold(Operator):
@@ -85,10 +75,10 @@ class T4P_OT_select_non_manifold(Operator):
         editable_object = context.edit_object
         mesh = getattr(editable_object, "data", None)
         if mesh is not None:
-            bm = get_bmesh(mesh)
-            non_manifold_count = len(get_selected_verts(bm))
+            # The Edit mode mesh keeps its selection totals up to date, so
+            # the count needs no pass over the BMesh vertices.
+            non_manifold_count = mesh.total_vert_sel
             set_object_analysis_stats(editable_object, non_manifold_count=non_manifold_count)
-            bmesh.update_edit_mesh(mesh)
 
         return {"FINISHED"}
 
@@ -106,9 +96,9 @@ class T4P_OT_focus_non_manifold(Operator):
 
         mesh = editable_object.data
         bpy.ops.mesh.reveal(select=False)
-        bpy.ops.mesh.select_all(action="DESELECT")
-
         bpy.ops.mesh.select_mode(use_extend=False, use_expand=False, type='VERT')
+        # The selection operator does not extend, so it replaces whatever was
+        # selected before.
         select_non_manifold_verts(
             use_wire=True,
             use_boundary=True,
@@ -123,41 +113,37 @@ class T4P_OT_focus_non_manifold(Operator):
         selected_verts = get_selected_verts(bm)
         non_manifold_count = len(selected_verts)
         set_object_analysis_stats(editable_object, non_manifold_count=non_manifold_count)
-        bpy.ops.mesh.select_all(action="DESELECT")
-        bm = get_bmesh(mesh)
+
         if selected_faces:
-            first_face = [selected_faces[0].index]
-            select_faces(first_face, mesh, bm)
+            focused = selected_faces[0]
         elif selected_edges:
-            if len(selected_edges[0].link_faces):
-                first_face = [selected_edges[0].link_faces[0].index]
-                select_faces(first_face, mesh, bm)
-            else:
-                edge_index = [selected_edges[0].index]
-                select_edge(edge_index, mesh, bm)
+            edge = selected_edges[0]
+            focused = edge.link_faces[0] if edge.link_faces else edge
         elif selected_verts:
-            if len(selected_verts[0].link_faces):
-                first_face = [selected_verts[0].link_faces[0].index]
-                select_faces(first_face, mesh, bm)
-            else:
-                vert_index = [selected_verts[0].index]
-                select_verts(vert_index, mesh, bm)
+            vert = selected_verts[0]
+            focused = vert.link_faces[0] if vert.link_faces else vert
         else:
             self.report({"INFO"}, "No non manifold geometry were found.")
             return {"CANCELLED"}
 
-        bmesh.update_edit_mesh(mesh)
+        # ``select_set(False)`` on a vertex only clears the vertex flag; the
+        # flush in vertex select mode then clears every edge and face whose
+        # vertices are no longer all selected, which empties the selection.
+        for vert in selected_verts:
+            vert.select_set(False)
+        bm.select_flush_mode()
+        focused.select_set(True)
+        bmesh.update_edit_mesh(mesh, loop_triangles=False, destructive=False)
 
         focus_view_on_selected_faces(context)
 
-        bpy.ops.mesh.select_mode(use_extend=False, use_expand=False, type='VERT')
-        select_non_manifold_verts(
-            use_wire=True,
-            use_boundary=True,
-            use_multi_face=True,
-            use_non_contiguous=True,
-            use_verts=True,
-        )
+        # Put the non-manifold selection found above back instead of running
+        # the selection operator a second time.
+        focused.select_set(False)
+        for vert in selected_verts:
+            vert.select_set(True)
+        bm.select_flush_mode()
+        bmesh.update_edit_mesh(mesh, loop_triangles=False, destructive=False)
 
         return {"FINISHED"}
 
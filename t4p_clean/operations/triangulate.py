@@ -98,15 +98,14 @@ class T4P_OT_triangulate_selected(ModalTimerMixin, Operator):
         bm = bmesh.new()
         try:
             bm.from_mesh(mesh)
-            bm.faces.ensure_lookup_table()
-            num_faces = len(bm.faces)
-            _triangulate_bmesh(bm)
+            state.mesh_candidates += 1
+            # Meshes that are already triangulated are left untouched, so
+            # their data is not rewritten and re-tessellated for nothing.
+            if not _triangulate_bmesh(bm):
+                return
             bm.to_mesh(mesh)
             mesh.update()
-
-            state.mesh_candidates += 1
-            if len(bm.faces) > num_faces:
-                state.triangulated_count += 1
+            state.triangulated_count += 1
         finally:
             bm.free()
 
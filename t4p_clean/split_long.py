@@ -1,45 +1,60 @@
 from __future__ import annotations
 
-from math import radians
+from math import cos, radians
+from typing import Iterable, MutableSequence
 
 import bmesh
+import numpy as np
 
 from .main import bmesh_get_intersecting_face_indices
 
+_MIN_EDGE_LENGTH = 1e-6
+_SHARP_ANGLE_THRESHOLD = radians(15.0)
+# A corner is sharper than the threshold when the cosine of its angle is
+# larger, which can be tested on the squared dot product without ``acos``.
+_SHARP_COS_SQ = cos(_SHARP_ANGLE_THRESHOLD) ** 2
 
-def split_intersections(bm: bmesh.types.BMesh) -> bool:
 
-    sharp_angle_threshold = radians(15.0)
+def split_intersections(bm: bmesh.types.BMesh) -> bool:
+    """Split sharp faces around self-intersections in ``bm``."""
 
     face_indices = bmesh_get_intersecting_face_indices(bm)
-    face_indices = _collect_face_indices_with_neighbors(
-        bm, list(face_indices)
+    # Nothing below changes the face sequence until the edges are
+    # subdivided, so a single lookup table serves every helper.
+    bm.faces.ensure_lookup_table()
+    face_indices = _collect_face_indices_with_neighbors(bm, face_indices)
+    face_edges = _collect_sharp_face_edges(bm, face_indices)
+    if not face_edges:
+        return False
+
+    # Splitting keeps each ``BMEdge`` but moves one of its ends to the new
+    # midpoint, so edges are remembered by their original end vertices.
+    face_edge_ends = [
+        (frozenset(edge_a.verts), frozenset(edge_b.verts))
+        for edge_a, edge_b in face_edges
+    ]
+    midpoints = _split_edges_at_midpoints(
+        list({edge for pair in face_edges for edge in pair})
     )
-    iteration_split = False
-    for face_index in face_indices:
-        bm.faces.ensure_lookup_table()
-        if face_index >= len(bm.faces):
-            continue
-        face = bm.faces[face_index]
-        if not face.is_valid or len(face.edges) < 3:
+    for edge_ends_a, edge_ends_b in face_edge_ends:
+        midpoint_a = midpoints.get(edge_ends_a)
+        midpoint_b = midpoints.get(edge_ends_b)
+        if midpoint_a is None or midpoint_b is None:
             continue
-        if _split_face(bm, face, sharp_angle_threshold):
-            iteration_split = True
+        _connect_midpoints_if_possible(midpoint_a, midpoint_b)
+    _triangulate_touched_faces(bm, midpoints.values())
     bm.normal_update()
 
-    return iteration_split
+    return bool(midpoints)
 
 
 def split_selection(bm: bmesh.types.BMesh):
-    sharp_angle_threshold = radians(15.0)
-
-    bm.faces.ensure_lookup_table()
     selected_visible_faces = [f for f in bm.faces if f.select and not f.hide]
     edges_to_split = set()
     for face in selected_visible_faces:
-        angle = _find_smallest_face_angle(face)
-        if angle < sharp_angle_threshold:
-            edges_to_split.update(_collect_longest_edges(face))
+        is_sharp, longest_edges = _measure_face_shape(face)
+        if is_sharp:
+            edges_to_split.update(longest_edges)
 
     bmesh.ops.subdivide_edges(
         bm,
@@ -49,151 +64,231 @@ def split_selection(bm: bmesh.types.BMesh):
         smooth=0.0,
     )
 
-    bmesh.ops.triangulate(bm, faces=selected_visible_faces)
+    bmesh.ops.triangulate(
+        bm,
+        faces=[
+            face
+            for face in selected_visible_faces
+            if face.is_valid and len(face.edges) > 3
+        ],
+    )
     bm.normal_update()
 
 
+def _triangulate_touched_faces(
+    bm: bmesh.types.BMesh, midpoints: Iterable[bmesh.types.BMVert]
+) -> None:
+    """Triangulate only the faces around ``midpoints`` that are no longer triangles."""
+
+    faces = {
+        face
+        for vert in midpoints
+        if vert.is_valid
+        for face in vert.link_faces
+        if len(face.edges) > 3
+    }
+    if faces:
+        bmesh.ops.triangulate(bm, faces=list(faces))
+
+
 def _collect_face_indices_with_neighbors(
-    bm: bmesh.types.BMesh, intersection_indices: list[int]
+    bm: bmesh.types.BMesh, intersection_indices: MutableSequence[int]
 ) -> list[int]:
-    bm.faces.ensure_lookup_table()
-    faces_to_visit: list[int] = []
-    seen: set[int] = set()
-
-    for face_index, face in _iter_valid_intersecting_faces(bm, intersection_indices):
-        if face_index in seen:
-            continue
-        seen.add(face_index)
-        faces_to_visit.append(face_index)
+    """Return the intersecting faces and their edge neighbours, sorted."""
 
-        for edge in list(face.edges):
-            if not edge.is_valid:
-                continue
-            for neighbor in edge.link_faces:
-                if not neighbor.is_valid or len(neighbor.edges) < 3:
-                    continue
-                neighbor_index = neighbor.index
-                if neighbor_index in seen:
-                    continue
-                seen.add(neighbor_index)
-                faces_to_visit.append(neighbor_index)
+    valid_faces = _iter_valid_intersecting_faces(bm, intersection_indices)
+    if not valid_faces:
+        return []
 
-    return faces_to_visit
+    seed_indices = np.fromiter(
+        (face_index for face_index, _ in valid_faces),
+        dtype=np.int32,
+        count=len(valid_faces),
+    )
+    neighbor_indices = np.fromiter(
+        (
+            neighbor.index
+            for _, face in valid_faces
+            for edge in face.edges
+            for neighbor in edge.link_faces
+            if len(neighbor.edges) >= 3
+        ),
+        dtype=np.int32,
+    )
+    return np.union1d(seed_indices, neighbor_indices).tolist()
 
 
-def _split_face(
+def _collect_sharp_face_edges(
     bm: bmesh.types.BMesh,
-    face: bmesh.types.BMFace,
-    sharp_angle_threshold: float,
-) -> bool:
-    if not face.is_valid or not face.loops:
-        return False
-    smallest_angle = _find_smallest_face_angle(face)
-    if smallest_angle >= sharp_angle_threshold:
-        return False
-    longest_edges = _collect_longest_edges(face)
-    if len(longest_edges) < 2:
-        return False
-    midpoint_vertices = _subdivide_edges_and_collect_midpoints(bm, longest_edges)
-    return _connect_midpoints_if_possible(bm, midpoint_vertices)
+    face_indices: list[int],
+) -> list[tuple[bmesh.types.BMEdge, bmesh.types.BMEdge]]:
+    """Return the two longest edges of every sharp face in ``face_indices``."""
+
+    face_edges = []
+    for _, face in _iter_valid_intersecting_faces(bm, face_indices):
+        is_sharp, longest_edges = _measure_face_shape(face)
+        if not is_sharp or len(longest_edges) < 2:
+            continue
+        face_edges.append((longest_edges[0], longest_edges[1]))
+    return face_edges
 
 
 def _iter_valid_intersecting_faces(
-    bm: bmesh.types.BMesh, intersection_indices: list[int]
+    bm: bmesh.types.BMesh, intersection_indices: MutableSequence[int]
 ) -> list[tuple[int, bmesh.types.BMFace]]:
-    bm.faces.ensure_lookup_table()
+    indices = np.asarray(intersection_indices, dtype=np.int64)
+    indices = indices[(indices >= 0) & (indices < len(bm.faces))]
+    faces = bm.faces
     valid: list[tuple[int, bmesh.types.BMFace]] = []
-    for face_index in intersection_indices:
-        if face_index >= len(bm.faces):
-            continue
-        face = bm.faces[face_index]
-        if not face.is_valid or len(face.edges) < 3:
-            continue
-        valid.append((face_index, face))
+    for face_index in indices.tolist():
+        face = faces[face_index]
+        if face.is_valid and len(face.edges) >= 3:
+            valid.append((face_index, face))
     return valid
 
 
-def _find_smallest_face_angle(face: bmesh.types.BMFace) -> float:
-    smallest_angle = float("inf")
+def _measure_face_shape(
+    face: bmesh.types.BMFace,
+) -> tuple[bool, list[bmesh.types.BMEdge]]:
+    """Return whether ``face`` has a sharp corner and its two longest edges.
+
+    Both are gathered in a single walk over the face loops.
+    """
+
+    if len(face.loops) == 3:
+        triangle_shape = _measure_triangle_shape(face)
+        if triangle_shape is not None:
+            return triangle_shape
+
+    min_length_sq = _MIN_EDGE_LENGTH * _MIN_EDGE_LENGTH
+    is_sharp = False
+    longest: tuple[float, bmesh.types.BMEdge | None] = (0.0, None)
+    second: tuple[float, bmesh.types.BMEdge | None] = (0.0, None)
+
     for loop in face.loops:
-        prev_vector = loop.link_loop_prev.vert.co - loop.vert.co
-        next_vector = loop.link_loop_next.vert.co - loop.vert.co
-        if prev_vector.length <= 1e-6 or next_vector.length <= 1e-6:
+        co = loop.vert.co
+        next_vector = loop.link_loop_next.vert.co - co
+        next_length_sq = next_vector.length_squared
+        if next_length_sq <= min_length_sq:
             continue
-        angle = prev_vector.angle(next_vector)
-        if angle < smallest_angle:
-            smallest_angle = angle
-    return smallest_angle
 
+        edge = loop.edge
+        if edge.is_valid:
+            if next_length_sq > longest[0]:
+                second = longest
+                longest = (next_length_sq, edge)
+            elif next_length_sq > second[0]:
+                second = (next_length_sq, edge)
 
-def _collect_longest_edges(
-    face: bmesh.types.BMFace,
-) -> list[bmesh.types.BMEdge]:
-    edge_lengths: list[tuple[float, bmesh.types.BMEdge]] = []
-    for edge in face.edges:
-        if not edge.is_valid:
+        if is_sharp:
             continue
-        length = edge.calc_length()
-        if length <= 1e-6:
+        prev_vector = loop.link_loop_prev.vert.co - co
+        prev_length_sq = prev_vector.length_squared
+        if prev_length_sq <= min_length_sq:
             continue
-        edge_lengths.append((length, edge))
-    if len(edge_lengths) < 2:
-        return []
-    edge_lengths.sort(key=lambda item: item[0], reverse=True)
-    return [edge for _, edge in edge_lengths[:2] if edge.is_valid]
+        dot = prev_vector.dot(next_vector)
+        if dot > 0.0 and dot * dot > _SHARP_COS_SQ * prev_length_sq * next_length_sq:
+            is_sharp = True
+
+    if second[1] is None:
+        return is_sharp, []
+    return is_sharp, [longest[1], second[1]]
+
+
+def _measure_triangle_shape(
+    face: bmesh.types.BMFace,
+) -> tuple[bool, list[bmesh.types.BMEdge]] | None:
+    """Straight-line version of ``_measure_face_shape`` for triangles.
+
+    Returns ``None`` for degenerate triangles so the generic walk handles them.
+    """
+
+    loop_0, loop_1, loop_2 = face.loops
+    co_0 = loop_0.vert.co
+    co_1 = loop_1.vert.co
+    co_2 = loop_2.vert.co
+    edge_vector_0 = co_1 - co_0
+    edge_vector_1 = co_2 - co_1
+    edge_vector_2 = co_0 - co_2
+    length_sq_0 = edge_vector_0.length_squared
+    length_sq_1 = edge_vector_1.length_squared
+    length_sq_2 = edge_vector_2.length_squared
+
+    min_length_sq = _MIN_EDGE_LENGTH * _MIN_EDGE_LENGTH
+    if min(length_sq_0, length_sq_1, length_sq_2) <= min_length_sq:
+        return None
+
+    # Each corner sits between two edge vectors that point head to tail, so
+    # its angle is acute when their dot product is negative.
+    dot_0 = edge_vector_2.dot(edge_vector_0)
+    dot_1 = edge_vector_0.dot(edge_vector_1)
+    dot_2 = edge_vector_1.dot(edge_vector_2)
+    is_sharp = (
+        (dot_0 < 0.0 and dot_0 * dot_0 > _SHARP_COS_SQ * length_sq_2 * length_sq_0)
+        or (dot_1 < 0.0 and dot_1 * dot_1 > _SHARP_COS_SQ * length_sq_0 * length_sq_1)
+        or (dot_2 < 0.0 and dot_2 * dot_2 > _SHARP_COS_SQ * length_sq_1 * length_sq_2)
+    )
+
+    edge_0 = loop_0.edge
+    edge_1 = loop_1.edge
+    edge_2 = loop_2.edge
+    if length_sq_0 <= length_sq_1 and length_sq_0 <= length_sq_2:
+        longest_edges = (
+            [edge_1, edge_2] if length_sq_1 >= length_sq_2 else [edge_2, edge_1]
+        )
+    elif length_sq_1 <= length_sq_2:
+        longest_edges = (
+            [edge_0, edge_2] if length_sq_0 >= length_sq_2 else [edge_2, edge_0]
+        )
+    else:
+        longest_edges = (
+            [edge_0, edge_1] if length_sq_0 >= length_sq_1 else [edge_1, edge_0]
+        )
+    return is_sharp, longest_edges
+
+
+def _split_edges_at_midpoints(
+    edges: list[bmesh.types.BMEdge],
+) -> dict[frozenset[bmesh.types.BMVert], bmesh.types.BMVert]:
+    """Split each of ``edges`` in half.
 
+    Returns the new midpoint keyed by the end vertices of its original edge.
+    """
 
-def _subdivide_edges_and_collect_midpoints(
-    bm: bmesh.types.BMesh, edges: list[bmesh.types.BMEdge]
-) -> list[bmesh.types.BMVert]:
-    midpoint_vertices: list[bmesh.types.BMVert] = []
+    midpoints: dict[frozenset[bmesh.types.BMVert], bmesh.types.BMVert] = {}
     for edge in edges:
         if not edge.is_valid:
             continue
-        result = bmesh.ops.subdivide_edges(
-            bm,
-            edges=[edge],
-            cuts=1,
-            use_grid_fill=False,
-            smooth=0.0,
-        )
-        new_vertex = next(
-            (
-                geom
-                for geom in result.get("geom_split", [])
-                if isinstance(geom, bmesh.types.BMVert) and geom.is_valid
-            ),
-            None,
-        )
-        if new_vertex is not None and new_vertex.is_valid:
-            midpoint_vertices.append(new_vertex)
-    return [vert for vert in midpoint_vertices if vert.is_valid]
+        ends = frozenset(edge.verts)
+        _, midpoint = bmesh.utils.edge_split(edge, edge.verts[0], 0.5)
+        midpoints[ends] = midpoint
+    return midpoints
 
 
-def _connect_midpoints_if_possible(
-    bm: bmesh.types.BMesh,
-    midpoint_vertices: list[bmesh.types.BMVert],
-) -> bool:
-    if len(midpoint_vertices) < 2:
-        return False
-    vert_a, vert_b = midpoint_vertices[:2]
+def _find_connectable_face(
+    vert_a: bmesh.types.BMVert, vert_b: bmesh.types.BMVert
+) -> bmesh.types.BMFace | None:
+    """Return a face that ``vert_a`` and ``vert_b`` can be connected across."""
+
     if vert_a == vert_b:
-        return False
+        return None
     if not vert_a.is_valid or not vert_b.is_valid:
-        return False
-    shared_faces = set(vert_a.link_faces) & set(vert_b.link_faces)
-    if not shared_faces:
-        return False
-    has_existing_edge = any(
-        edge for edge in vert_a.link_edges if edge.is_valid and vert_b in edge.verts
-    )
-    if has_existing_edge:
-        return False
+        return None
+    for edge in vert_a.link_edges:
+        if edge.is_valid and edge.other_vert(vert_a) == vert_b:
+            return None
+    faces_a = set(vert_a.link_faces)
+    for face in vert_b.link_faces:
+        if face in faces_a:
+            return face
+    return None
 
-    result = bmesh.ops.connect_verts(bm, verts=[vert_a, vert_b])
-    new_edges = [
-        edge
-        for edge in result.get("edges", [])
-        if isinstance(edge, bmesh.types.BMEdge) and edge.is_valid
-    ]
-    return bool(new_edges)
+
+def _connect_midpoints_if_possible(
+    vert_a: bmesh.types.BMVert, vert_b: bmesh.types.BMVert
+) -> bool:
+    face = _find_connectable_face(vert_a, vert_b)
+    if face is None:
+        return False
+    bmesh.utils.face_split(face, vert_a, vert_b)
+    return True